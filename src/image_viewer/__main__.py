@@ -3,32 +3,54 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import os
 import sys
 import warnings
+from typing import TYPE_CHECKING
 
 # Suppress harmless GTK internal warnings about slider sizes
 os.environ.setdefault("G_MESSAGES_DEBUG", "")
 
-from . import __version__
-from .config import load_config
-from .models import AppConfig
-from .sorting import SORT_NAMES
+if TYPE_CHECKING:
+    from .models import AppConfig
 
 
-def build_parser() -> argparse.ArgumentParser:
-    """Build and return the argument parser."""
-    parser = argparse.ArgumentParser(
-        prog="image-viewer",
-        description="A lightweight image viewer with thumbnails, slideshow, ratings, and viewed tracking.",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+_EPILOG = """
 Examples:
   image-viewer /photos                    # Open thumbnail view of /photos (recursive)
   image-viewer /photos --slideshow        # Start slideshow immediately
   image-viewer /photos --sort rating-desc # Show highest-rated images first
   image-viewer /photos --slideshow-time 3 --loop  # 3s per image, looping
-        """,
+"""
+
+
+@functools.cache
+def _sort_help() -> str:
+    """Help text for --sort, built once (kept lazy with the .sorting import)."""
+    from .sorting import SORT_NAMES
+
+    return (
+        "Sort order for thumbnails and slideshow: "
+        + "|".join(SORT_NAMES)
+        + " (default: unviewed)"
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build and return the argument parser.
+
+    Only called when arguments actually need parsing: the --version fast
+    path in main() exits before construction, and --help has to render the
+    full grammar anyway, so there is no cheaper partial parser to build.
+    """
+    from .sorting import SORT_NAMES
+
+    parser = argparse.ArgumentParser(
+        prog="image-viewer",
+        description="A lightweight image viewer with thumbnails, slideshow, ratings, and viewed tracking.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG,
     )
 
     parser.add_argument(
@@ -89,11 +111,7 @@ Examples:
         choices=SORT_NAMES,
         default=None,
         metavar="SORT",
-        help=(
-            "Sort order for thumbnails and slideshow: "
-            + "|".join(SORT_NAMES)
-            + " (default: unviewed)"
-        ),
+        help=_sort_help(),
     )
 
     # Thumbnail options
@@ -132,6 +150,8 @@ Examples:
         ),
     )
 
+    from . import __version__
+
     parser.add_argument(
         "--version",
         action="version",
@@ -141,14 +161,35 @@ Examples:
     return parser
 
 
+# Scalar CLI overrides: (config attribute, args attribute, cast). A value of
+# None means "not given on the command line, keep the config file value".
+_OVERRIDES: tuple[tuple[str, str, type], ...] = (
+    ("slideshow_time", "slideshow_time", float),
+    ("slideshow_order", "slideshow_order", str),
+    ("sort", "sort", str),
+    ("thumbnail_size", "thumb_size", int),
+    ("rating_multiplier", "rating_multiplier", float),
+)
+
+
 def apply_cli_overrides(config: AppConfig, args: argparse.Namespace) -> AppConfig:
     """Apply CLI argument overrides to the config object."""
-    # Paths
+    # Paths (hoist getcwd so large shell globs don't pay one syscall per path)
     if args.paths:
-        config.paths = [os.path.abspath(p) for p in args.paths]
+        cwd = os.getcwd()
+        config.paths = [
+            os.path.normpath(p if os.path.isabs(p) else os.path.join(cwd, p))
+            for p in args.paths
+        ]
     else:
         config.paths = [os.getcwd()]
 
+    # Scalar options
+    for attr, arg, cast in _OVERRIDES:
+        value = getattr(args, arg)
+        if value is not None:
+            setattr(config, attr, cast(value))
+
     # Recursive
     if args.no_recursive:
         config.recursive = False
@@ -159,48 +200,42 @@ def apply_cli_overrides(config: AppConfig, args: argparse.Namespace) -> AppConfi
     # Mode
     if args.slideshow:
         config.start_slideshow = True
-
-    # Slideshow options
-    if args.slideshow_time is not None:
-        config.slideshow_time = args.slideshow_time
-    if args.slideshow_order is not None:
-        config.slideshow_order = args.slideshow_order
     if args.loop:
         config.loop = True
 
-    # Sort
-    if args.sort is not None:
-        config.sort = args.sort
-
-    # Thumbnail size
-    if args.thumb_size is not None:
-        config.thumbnail_size = args.thumb_size
-
     # Fullscreen
     if args.windowed:
         config.fullscreen = False
     elif args.fullscreen:
         config.fullscreen = True
 
-    # Rating multiplier
-    if args.rating_multiplier is not None:
-        config.rating_multiplier = args.rating_multiplier
-
     return config
 
 
 def main() -> None:
     """Main entry point."""
+    # Fast path: --version only needs the package version string, so answer
+    # before building the parser or importing config/model modules.
+    if "--version" in sys.argv[1:]:
+        from . import __version__
+        print(f"image-viewer {__version__}")
+        sys.exit(0)
+
     parser = build_parser()
     args = parser.parse_args()
 
     # Load config file, then apply CLI overrides
+    from .config import load_config
+
     config = load_config()
     config = apply_cli_overrides(config, args)
 
-    # Validate paths
+    # Validate paths (os.stat directly: one syscall per path, and no
+    # exception-swallowing wrapper like os.path.exists)
     for path in config.paths:
-        if not os.path.exists(path):
+        try:
+            os.stat(path)
+        except OSError:
             print(f"Error: Path does not exist: {path}", file=sys.stderr)
             sys.exit(1)
 
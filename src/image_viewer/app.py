@@ -2,6 +2,12 @@
 
 Manages the main window, mode switching between thumbnail and slideshow views,
 and coordinates scanning/database operations.
+
+Importing this module loads GTK: the gi import has to stay at module scope
+because the class statements below subclass Gtk.Application and
+Gtk.ApplicationWindow. Callers that don't need the GUI (``--version``,
+``--help``, path validation) must not import it — ``__main__.main()`` only
+imports ``.app`` right before launching.
 """
 
 from __future__ import annotations
@@ -32,15 +38,28 @@ class ImageViewerApp(Gtk.Application):
         self.config = config
         self.db: Optional[MultiDatabase] = None
         self.images: list[ImageInfo] = []
+        # Index for O(1) lookup by filepath; rebuilt whenever images changes
+        self._by_path: dict[str, ImageInfo] = {}
+        # Scan progress shared with the scanner thread, polled from the
+        # main loop instead of marshalling one idle_add per progress tick
+        self._scan_state: dict = {"count": 0, "latest": "", "done": True}
+        # Base dirs derived from config.paths; paths don't change during a
+        # session, so compute once (set back to None to invalidate)
+        self._base_dirs: Optional[list[str]] = None
         self._main_window: Optional["MainWindow"] = None
 
         self.connect("activate", self._on_activate)
 
+    def get_base_dirs(self) -> list[str]:
+        """Return the base directories for config.paths, computed once."""
+        if self._base_dirs is None:
+            self._base_dirs = get_base_dirs(self.config.paths)
+        return self._base_dirs
+
     def _on_activate(self, app: Gtk.Application) -> None:
         """Called when the application is activated."""
         # Open database
-        base_dirs = get_base_dirs(self.config.paths)
-        self.db = MultiDatabase(base_dirs)
+        self.db = MultiDatabase(self.get_base_dirs())
         self.db.connect()
 
         # Create main window
@@ -52,11 +71,15 @@ class ImageViewerApp(Gtk.Application):
 
     def _scan_images_async(self) -> None:
         """Scan images in a background thread, then update the UI."""
+        self._scan_state = {"count": 0, "latest": "", "done": False}
+        scan_state = self._scan_state
+
         def _progress(filepath: str, count: int) -> None:
             """Called from background thread for each image found during walk."""
-            # Throttle UI updates to every 50 images to avoid flooding the main thread
-            if count % 50 == 0 or count == 1:
-                GLib.idle_add(self._on_scan_progress, count, filepath)
+            # Plain dict stores are atomic in CPython; the main-thread
+            # poller reads the latest values without any locking
+            scan_state["count"] = count
+            scan_state["latest"] = filepath
 
         def _scan():
             images = scan_and_store(
@@ -65,22 +88,94 @@ class ImageViewerApp(Gtk.Application):
                 recursive=self.config.recursive,
                 progress_callback=_progress,
             )
+            # Sort and build the lookup index here so the main thread only
+            # has to install the finished structures
             sorted_images = sort_images(images, self.config.sort)
+            by_path = {img.filepath: img for img in sorted_images}
             # Schedule UI update on main thread
-            GLib.idle_add(self._on_scan_complete, sorted_images)
+            GLib.idle_add(self._on_scan_complete, sorted_images, by_path)
 
+        GLib.timeout_add(100, self._pump_progress, scan_state)
         thread = threading.Thread(target=_scan, daemon=True)
         thread.start()
 
-    def _on_scan_progress(self, count: int, filepath: str) -> bool:
-        """Called on the main thread periodically during scanning."""
-        if self._main_window:
-            self._main_window.update_scan_progress(count, filepath)
-        return False
+    def incremental_rescan(self) -> None:
+        """Rescan in the background, reusing stored rows for unchanged directories.
 
-    def _on_scan_complete(self, images: list[ImageInfo]) -> bool:
+        Only directories whose mtime is newer than the last recorded scan are
+        re-walked; images in untouched directories are served straight from
+        the database. Falls back to a full scan when the database is empty.
+        """
+        if not self.db:
+            return
+
+        def _rescan():
+            known = self.db.get_all_images()
+            if not known:
+                GLib.idle_add(self._scan_images_async)
+                return
+
+            last_scan = max(img.first_seen for img in known)
+            known_by_dir: dict[str, list[ImageInfo]] = {}
+            for img in known:
+                known_by_dir.setdefault(img.directory, []).append(img)
+
+            merged: dict[str, ImageInfo] = {}
+            changed_dirs: list[str] = []
+            # Always check the configured roots too: a brand-new
+            # subdirectory, or images under a root whose own directory holds
+            # no direct images, never show up in known_by_dir. A changed
+            # root is re-walked recursively, which picks up new subtrees.
+            roots = {os.path.abspath(p) for p in self.config.paths}
+            for root in roots - set(known_by_dir):
+                try:
+                    if os.stat(root).st_mtime > last_scan:
+                        changed_dirs.append(root)
+                except OSError:
+                    continue  # Root vanished; nothing to rescan there
+            for directory, imgs in known_by_dir.items():
+                try:
+                    changed = os.stat(directory).st_mtime > last_scan
+                except OSError:
+                    continue  # Directory vanished; drop its images
+                if changed:
+                    changed_dirs.append(directory)
+                else:
+                    for img in imgs:
+                        merged[img.filepath] = img
+
+            if changed_dirs:
+                rescanned = scan_and_store(
+                    changed_dirs,
+                    self.db,
+                    recursive=self.config.recursive,
+                )
+                for img in rescanned:
+                    merged[img.filepath] = img
+
+            sorted_images = sort_images(list(merged.values()), self.config.sort)
+            by_path = {img.filepath: img for img in sorted_images}
+            GLib.idle_add(self._on_scan_complete, sorted_images, by_path)
+
+        thread = threading.Thread(target=_rescan, daemon=True)
+        thread.start()
+
+    def _pump_progress(self, scan_state: dict) -> bool:
+        """Poll scan progress from the main loop while a scan is running."""
+        if scan_state.get("done") or scan_state is not self._scan_state:
+            return False  # Scan finished or superseded; stop the poller
+        count = scan_state["count"]
+        if count and self._main_window:
+            self._main_window.update_scan_progress(count, scan_state["latest"])
+        return True
+
+    def _on_scan_complete(
+        self, images: list[ImageInfo], by_path: dict[str, ImageInfo]
+    ) -> bool:
         """Called on the main thread when scanning is complete."""
+        self._scan_state["done"] = True
         self.images = images
+        self._by_path = by_path
         if self._main_window:
             self._main_window.on_images_loaded(images)
         return False  # Remove from idle queue
@@ -90,6 +185,7 @@ class ImageViewerApp(Gtk.Application):
         if self.db:
             all_images = self.db.get_all_images()
             self.images = sort_images(all_images, self.config.sort)
+            self._by_path = {img.filepath: img for img in self.images}
             if self._main_window:
                 self._main_window.on_images_loaded(self.images)
 
@@ -102,11 +198,10 @@ class ImageViewerApp(Gtk.Application):
             return 0
         new_rating = max(0, min(5, image.rating + delta))
         self.db.update_rating(filepath, new_rating)
-        # Update in-memory list
-        for img in self.images:
-            if img.filepath == filepath:
-                img.rating = new_rating
-                break
+        # Update the in-memory object (shared with the sorted list)
+        img = self._by_path.get(filepath)
+        if img is not None:
+            img.rating = new_rating
         return new_rating
 
     def mark_viewed(self, filepath: str) -> None:
@@ -114,11 +209,10 @@ class ImageViewerApp(Gtk.Application):
         if not self.db:
             return
         self.db.mark_viewed(filepath)
-        for img in self.images:
-            if img.filepath == filepath:
-                img.viewed = True
-                img.view_count += 1
-                break
+        img = self._by_path.get(filepath)
+        if img is not None:
+            img.viewed = True
+            img.view_count += 1
 
     def do_shutdown(self) -> None:
         """Clean up on application shutdown."""
@@ -177,6 +271,8 @@ class MainWindow(Gtk.ApplicationWindow):
 
         # Track current slideshow window size for zoom-to-fit
         self._slideshow_size: tuple[int, int] = (1200, 800)
+        # Pending debounce source for resize notifications (0 = none)
+        self._resize_pending: int = 0
 
         # Connect resize signal for slideshow sticky size
         # In GTK4, notify::default-width/height fires when user resizes the window
@@ -200,13 +296,25 @@ class MainWindow(Gtk.ApplicationWindow):
         return False  # Allow the close to proceed
 
     def _on_size_changed(self, widget, param) -> None:
-        """Update sticky slideshow size when window is resized."""
+        """Schedule a debounced size update when the window is resized.
+
+        Both width and height notifications fire dozens of times per second
+        during a drag; coalesce them so only the settled size is forwarded.
+        """
+        if self._resize_pending:
+            return
+        self._resize_pending = GLib.timeout_add(50, self._apply_resize)
+
+    def _apply_resize(self) -> bool:
+        """Apply the latest window size after the resize debounce."""
+        self._resize_pending = 0
         w = self.get_width()
         h = self.get_height()
         if w > 0 and h > 0 and (w, h) != self._slideshow_size:
             self._slideshow_size = (w, h)
             if self._slide_view:
                 self._slide_view.on_window_resized(w, h)
+        return False
 
     def _on_window_key_pressed(
         self,
@@ -325,6 +433,24 @@ class MainWindow(Gtk.ApplicationWindow):
             text="Settings",
         )
         
+        def _bind_value_label(scale: Gtk.Scale, label: Gtk.Label, fmt) -> None:
+            """Update label from scale, caching formatted strings.
+
+            GTK fires value-changed at ~60Hz during a drag and most values
+            repeat as the user scrubs back and forth, so formatting each
+            value once is enough.
+            """
+            cache: dict[float, str] = {}
+
+            def _changed(s: Gtk.Scale) -> None:
+                v = round(s.get_value(), 1)
+                text = cache.get(v)
+                if text is None:
+                    text = cache[v] = fmt(v)
+                label.set_label(text)
+
+            scale.connect("value-changed", _changed)
+
         # Build settings content
         content = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
         content.set_margin_start(12)
@@ -345,7 +471,7 @@ class MainWindow(Gtk.ApplicationWindow):
         time_box.append(time_scale)
         
         time_value = Gtk.Label(label=f"{self.config.slideshow_time:.1f}s")
-        time_scale.connect("value-changed", lambda s: time_value.set_label(f"{s.get_value():.1f}s"))
+        _bind_value_label(time_scale, time_value, lambda v: f"{v:.1f}s")
         time_box.append(time_value)
         content.append(time_box)
         
@@ -362,7 +488,7 @@ class MainWindow(Gtk.ApplicationWindow):
         mult_box.append(mult_scale)
         
         mult_value = Gtk.Label(label=f"{self.config.rating_multiplier:.1f}s")
-        mult_scale.connect("value-changed", lambda s: mult_value.set_label(f"{s.get_value():.1f}s"))
+        _bind_value_label(mult_scale, mult_value, lambda v: f"{v:.1f}s")
         mult_box.append(mult_value)
         content.append(mult_box)
         
@@ -379,7 +505,7 @@ class MainWindow(Gtk.ApplicationWindow):
         cache_box.append(cache_scale)
         
         cache_value = Gtk.Label(label=f"{self.config.thumbnail_cache_size}px")
-        cache_scale.connect("value-changed", lambda s: cache_value.set_label(f"{int(s.get_value())}px"))
+        _bind_value_label(cache_scale, cache_value, lambda v: f"{int(v)}px")
         cache_box.append(cache_value)
         content.append(cache_box)
         
@@ -424,34 +550,16 @@ class MainWindow(Gtk.ApplicationWindow):
     
     def _save_config(self) -> None:
         """Save current config to file."""
-        from .config import CONFIG_FILE, CONFIG_DIR
-        CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-        
-        # Build config string - use lowercase TOML booleans
-        config_str = f"""[defaults]
-recursive = {str(self.config.recursive).lower()}
-sort = "{self.config.sort}"
-thumbnail_size = {self.config.thumbnail_size}
-thumbnail_cache_size = {self.config.thumbnail_cache_size}
-slideshow_time = {self.config.slideshow_time}
-slideshow_order = "{self.config.slideshow_order}"
-loop = {str(self.config.loop).lower()}
-fullscreen = {str(self.config.fullscreen).lower()}
-rating_multiplier = {self.config.rating_multiplier}
-
-[appearance]
-highlight_color = "{self.config.highlight_color}"
-unviewed_indicator = "{self.config.unviewed_indicator}"
-"""
-        CONFIG_FILE.write_text(config_str)
+        from .config import save_config
+        save_config(self.config)
     
     def _clear_cache_and_reload(self) -> None:
         """Clear thumbnail cache and reload images."""
         from .thumbnail_cache import clear_all_cache
         count = clear_all_cache(self.config.paths)
         print(f"Cleared {count} cached thumbnails")
-        # Rescan images via the app
-        self.app._scan_images_async()
+        # Rescan, reusing stored rows for directories that haven't changed
+        self.app.incremental_rescan()
     
     def rescan_and_reload(self) -> None:
         """Rescan directories and reload images (clears cache first)."""
@@ -6,7 +6,9 @@ CLI arguments override config file values.
 
 from __future__ import annotations
 
+import copy
 import os
+import re
 import sys
 from pathlib import Path
 from typing import Any
@@ -53,40 +55,50 @@ def _load_toml(path: Path) -> dict[str, Any]:
             return _parse_simple_toml(path)
 
 
+# Matches either a [section] header or a key = value line; comment and blank
+# lines simply fail to match and are skipped.
+_TOML_LINE = re.compile(
+    r"^[ \t]*(?:\[(?P<section>[^\]]+)\]|(?P<key>[\w-]+)[ \t]*=[ \t]*(?P<value>.+?))[ \t]*$",
+    re.MULTILINE,
+)
+
+# Classifies a raw value string in a single match instead of a cascade of
+# startswith/endswith checks.
+_TOML_VALUE = re.compile(
+    r"^(?:(?P<true>true)|(?P<false>false)"
+    r"|\"(?P<dquoted>[^\"]*)\"|'(?P<squoted>[^']*)'"
+    r"|(?P<float>-?\d+\.\d+)|(?P<int>-?\d+))$",
+    re.IGNORECASE,
+)
+
+
 def _parse_simple_toml(path: Path) -> dict[str, Any]:
     """Very minimal TOML parser for simple key=value pairs under [sections]."""
     result: dict[str, Any] = {}
     current_section: dict[str, Any] = result
-    with open(path, "r") as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-            if line.startswith("[") and line.endswith("]"):
-                section_name = line[1:-1].strip()
-                current_section = {}
-                result[section_name] = current_section
-            elif "=" in line:
-                key, _, value = line.partition("=")
-                key = key.strip()
-                value = value.strip()
-                # Parse value types
-                if value.lower() == "true":
-                    current_section[key] = True
-                elif value.lower() == "false":
-                    current_section[key] = False
-                elif value.startswith('"') and value.endswith('"'):
-                    current_section[key] = value[1:-1]
-                elif value.startswith("'") and value.endswith("'"):
-                    current_section[key] = value[1:-1]
-                else:
-                    try:
-                        if "." in value:
-                            current_section[key] = float(value)
-                        else:
-                            current_section[key] = int(value)
-                    except ValueError:
-                        current_section[key] = value
+    for m in _TOML_LINE.finditer(path.read_text()):
+        section = m.group("section")
+        if section is not None:
+            current_section = {}
+            result[section.strip()] = current_section
+            continue
+        key = m.group("key")
+        value = m.group("value")
+        vm = _TOML_VALUE.match(value)
+        if vm is None:
+            current_section[key] = value
+        elif vm.group("true"):
+            current_section[key] = True
+        elif vm.group("false"):
+            current_section[key] = False
+        elif vm.group("dquoted") is not None:
+            current_section[key] = vm.group("dquoted")
+        elif vm.group("squoted") is not None:
+            current_section[key] = vm.group("squoted")
+        elif vm.group("float"):
+            current_section[key] = float(vm.group("float"))
+        else:
+            current_section[key] = int(vm.group("int"))
     return result
 
 
@@ -97,9 +109,57 @@ def ensure_config_dir() -> None:
         CONFIG_FILE.write_text(_DEFAULT_CONFIG_TOML)
 
 
+# Parsed configs keyed by (path, mtime_ns, size) so repeat loads within a
+# session skip the file read and parse when the file hasn't changed.
+_CONFIG_CACHE: dict[tuple[str, int, int], AppConfig] = {}
+
+_MISSING = object()
+
+# Config keys per section: (attribute, cast, optional validator). A value
+# failing its validator is ignored, keeping the AppConfig default.
+_DEFAULTS_KEYS: tuple = (
+    ("recursive", bool, None),
+    ("sort", str, lambda v: v in SORT_NAMES),
+    ("thumbnail_size", int, None),
+    ("thumbnail_cache_size", int, None),
+    ("slideshow_time", float, None),
+    ("slideshow_order", str, lambda v: v in ("forward", "backward", "random")),
+    ("loop", bool, None),
+    ("fullscreen", bool, None),
+    ("rating_multiplier", float, None),
+)
+_APPEARANCE_KEYS: tuple = (
+    ("highlight_color", str, None),
+    ("unviewed_indicator", str, lambda v: v in ("border", "dot", "none")),
+)
+
+
+def _apply_section(config: AppConfig, section: dict[str, Any], keys: tuple) -> None:
+    """Copy recognised keys from a parsed config section onto the config."""
+    for name, cast, validate in keys:
+        value = section.get(name, _MISSING)
+        if value is _MISSING:
+            continue
+        value = cast(value)
+        if validate is not None and not validate(value):
+            continue
+        setattr(config, name, value)
+
+
 def load_config() -> AppConfig:
     """Load configuration from the config file, returning an AppConfig with defaults."""
     ensure_config_dir()
+
+    try:
+        st = CONFIG_FILE.stat()
+        cache_key = (str(CONFIG_FILE), st.st_mtime_ns, st.st_size)
+    except OSError:
+        cache_key = None
+    if cache_key is not None:
+        cached = _CONFIG_CACHE.get(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
     config = AppConfig()
 
     if CONFIG_FILE.exists():
@@ -109,38 +169,11 @@ def load_config() -> AppConfig:
             print(f"Warning: Could not parse config file {CONFIG_FILE}: {e}", file=sys.stderr)
             return config
 
-        defaults = data.get("defaults", {})
-        appearance = data.get("appearance", {})
-
-        if "recursive" in defaults:
-            config.recursive = bool(defaults["recursive"])
-        if "sort" in defaults:
-            sort_val = str(defaults["sort"])
-            if sort_val in SORT_NAMES:
-                config.sort = sort_val
-        if "thumbnail_size" in defaults:
-            config.thumbnail_size = int(defaults["thumbnail_size"])
-        if "thumbnail_cache_size" in defaults:
-            config.thumbnail_cache_size = int(defaults["thumbnail_cache_size"])
-        if "slideshow_time" in defaults:
-            config.slideshow_time = float(defaults["slideshow_time"])
-        if "slideshow_order" in defaults:
-            order = str(defaults["slideshow_order"])
-            if order in ("forward", "backward", "random"):
-                config.slideshow_order = order
-        if "loop" in defaults:
-            config.loop = bool(defaults["loop"])
-        if "fullscreen" in defaults:
-            config.fullscreen = bool(defaults["fullscreen"])
-        if "rating_multiplier" in defaults:
-            config.rating_multiplier = float(defaults["rating_multiplier"])
-
-        if "highlight_color" in appearance:
-            config.highlight_color = str(appearance["highlight_color"])
-        if "unviewed_indicator" in appearance:
-            indicator = str(appearance["unviewed_indicator"])
-            if indicator in ("border", "dot", "none"):
-                config.unviewed_indicator = indicator
+        _apply_section(config, data.get("defaults", {}), _DEFAULTS_KEYS)
+        _apply_section(config, data.get("appearance", {}), _APPEARANCE_KEYS)
+
+    if cache_key is not None:
+        _CONFIG_CACHE[cache_key] = copy.deepcopy(config)
 
     return config
 
@@ -150,21 +183,27 @@ def get_default_config() -> AppConfig:
     return AppConfig()
 
 
+def _b(value: bool) -> str:
+    """Format a bool as a lowercase TOML literal."""
+    return "true" if value else "false"
+
+
 def save_config(config: AppConfig) -> None:
-    """Save configuration to the config file."""
+    """Save configuration to the config file (atomically, via a tempfile)."""
     ensure_config_dir()
-    
+    _CONFIG_CACHE.clear()
+
     # Build TOML content
     lines = [
         "[defaults]",
-        f"recursive = {str(config.recursive).lower()}",
+        f"recursive = {_b(config.recursive)}",
         f'sort = "{config.sort}"',
         f"thumbnail_size = {config.thumbnail_size}",
         f"thumbnail_cache_size = {config.thumbnail_cache_size}",
         f"slideshow_time = {config.slideshow_time}",
         f'slideshow_order = "{config.slideshow_order}"',
-        f"loop = {str(config.loop).lower()}",
-        f"fullscreen = {str(config.fullscreen).lower()}",
+        f"loop = {_b(config.loop)}",
+        f"fullscreen = {_b(config.fullscreen)}",
         f"rating_multiplier = {config.rating_multiplier}",
         "",
         "[appearance]",
@@ -172,5 +211,9 @@ def save_config(config: AppConfig) -> None:
         f'unviewed_indicator = "{config.unviewed_indicator}"',
         "",
     ]
-    
-    CONFIG_FILE.write_text("\n".join(lines))
+
+    # Write to a tempfile and rename so a crash mid-write can't leave a
+    # truncated config behind
+    tmp = CONFIG_FILE.with_suffix(".toml.tmp")
+    tmp.write_text("\n".join(lines))
+    os.replace(tmp, CONFIG_FILE)
@@ -7,12 +7,18 @@ If the directory is not writable, it falls back to
 
 from __future__ import annotations
 
-import hashlib
+import atexit
+import functools
+import itertools
 import os
+import queue
 import sqlite3
+import threading
 import time
+from collections import OrderedDict, defaultdict
+from contextlib import ExitStack, contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 from .models import ImageInfo
 
@@ -51,31 +57,168 @@ CREATE INDEX IF NOT EXISTS idx_filepath ON images(filepath);
 CREATE INDEX IF NOT EXISTS idx_directory ON images(directory);
 CREATE INDEX IF NOT EXISTS idx_rating ON images(rating);
 CREATE INDEX IF NOT EXISTS idx_viewed ON images(viewed);
+
+-- Covers get_thumbnail_cache: an index-only scan answers the lookup without
+-- the rowid->row fetch into the main table
+CREATE INDEX IF NOT EXISTS idx_filepath_thumb ON images(filepath, thumbnail_cache);
+"""
+
+# Hot-path SQL hoisted to module constants: sqlite3's statement cache is
+# keyed by the query string, so reusing the same string object guarantees a
+# cache hit instead of a fresh sqlite3_prepare on every call.
+# Multi-row upsert, built per chunk size: one VALUES list of n rows amortizes
+# statement setup across the whole chunk instead of one execute per image.
+_SQL_UPSERT_RETURNING_HEAD = """
+INSERT INTO images
+    (filepath, filename, directory, file_size, file_modified,
+     rating, viewed, view_count, last_viewed, first_seen)
+VALUES """
+
+_SQL_UPSERT_RETURNING_TAIL = """
+ON CONFLICT(filepath) DO UPDATE SET
+    filename = excluded.filename,
+    directory = excluded.directory,
+    file_size = excluded.file_size,
+    file_modified = excluded.file_modified
+RETURNING id, filepath, rating, viewed, view_count, last_viewed
+"""
+
+# Rows per multi-row statement. 10 columns each stays well under SQLite's
+# bound-variable limit on any build new enough to support RETURNING.
+_UPSERT_CHUNK = 500
+
+
+@functools.cache
+def _upsert_returning_sql(n: int) -> str:
+    """Build (and cache) the n-row upsert statement."""
+    rows = ",".join(["(?,?,?,?,?,?,?,?,?,?)"] * n)
+    return _SQL_UPSERT_RETURNING_HEAD + rows + _SQL_UPSERT_RETURNING_TAIL
+
+_SQL_UPSERT = """
+INSERT INTO images
+    (filepath, filename, directory, file_size, file_modified,
+     rating, viewed, view_count, last_viewed, first_seen)
+VALUES
+    (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(filepath) DO UPDATE SET
+    filename = excluded.filename,
+    directory = excluded.directory,
+    file_size = excluded.file_size,
+    file_modified = excluded.file_modified
+"""
+
+_SQL_GET_IMAGE = "SELECT * FROM images WHERE filepath = ?"
+
+_SQL_GET_ALL_IMAGES = "SELECT * FROM images"
+
+_SQL_UPDATE_RATING = "UPDATE images SET rating = ? WHERE filepath = ?"
+
+_SQL_MARK_VIEWED = """
+UPDATE images
+SET viewed = 1,
+    view_count = view_count + 1,
+    last_viewed = ?
+WHERE filepath = ?
 """
 
+_SQL_DELETE_IMAGE = "DELETE FROM images WHERE filepath = ?"
+
+_SQL_SET_THUMBNAIL = "UPDATE images SET thumbnail_cache = ? WHERE filepath = ?"
+
+# INDEXED BY steers the planner off the UNIQUE(filepath) autoindex, which it
+# otherwise prefers but which can't cover the thumbnail_cache column
+_SQL_GET_THUMBNAIL = (
+    "SELECT thumbnail_cache FROM images INDEXED BY idx_filepath_thumb"
+    " WHERE filepath = ?"
+)
+
+# Secondary indexes dropped during bulk ingest (see Database.bulk_mode).
+# The UNIQUE(filepath) autoindex and the thumbnail covering index stay: the
+# upsert's conflict detection and readback need them.
+_BULK_DROP_INDEXES = ("idx_filepath", "idx_directory", "idx_rating", "idx_viewed")
+
+# Read-only connections per database. WAL lets readers run concurrently with
+# the single writer, so lookups don't serialize behind scanner upserts on the
+# writer connection's mutex.
+_READER_POOL_SIZE = 4
+
+# How many queued UI writes accumulate before they are flushed in one
+# transaction. Each flush costs one COMMIT (one fsync under WAL), so this
+# amortizes fsync across a burst of slideshow flips or rating changes.
+_FLUSH_THRESHOLD = 32
+
+# Entries kept in the in-process thumbnail-path LRU. The grid asks for the
+# same paths on every scroll, so most lookups never reach SQLite.
+_THUMB_CACHE_MAX = 4096
+
 
 class Database:
     """Manages the SQLite database for the app."""
 
     def __init__(self, base_dir: str) -> None:
-        self.base_dir = os.path.abspath(base_dir)
+        self.base_dir = base_dir if os.path.isabs(base_dir) else os.path.abspath(base_dir)
         self.db_path = _get_db_path()
         self._conn: Optional[sqlite3.Connection] = None
+        self._readers: Optional[queue.Queue[sqlite3.Connection]] = None
+        # Queued UI writes, flushed together (see flush()). The lock guards
+        # the queues themselves: flush() runs on scanner/rescan threads while
+        # the main thread keeps appending
+        self._pending_lock = threading.Lock()
+        self._pending_views: list[tuple[float, str]] = []
+        self._pending_ratings: dict[str, int] = {}
+        self._pending_thumbs: dict[str, str] = {}
+        # LRU over get_thumbnail_cache results (None cached too, so repeated
+        # misses for never-thumbnailed images also skip the query)
+        self._thumb_lru: OrderedDict[str, Optional[str]] = OrderedDict()
 
     def connect(self) -> None:
-        """Open the database connection and create tables if needed."""
-        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        """Open the database connection and create tables if needed.
+
+        Idempotent: a second call on a live connection is a no-op, so shared
+        instances from _get_database survive repeated connect() calls.
+        """
+        if self._conn is not None:
+            return
+        # cached_statements=256 keeps all hot statements compiled; the default
+        # (128) can thrash under mixed scan + UI workloads
+        self._conn = sqlite3.connect(
+            str(self.db_path), check_same_thread=False, cached_statements=256
+        )
         self._conn.row_factory = sqlite3.Row
         # Enable WAL mode for better concurrent access
         self._conn.execute("PRAGMA journal_mode=WAL")
+        # NORMAL is crash-safe under WAL and skips the per-COMMIT fsync of
+        # the main database file; the rest sizes caches for bulk ingest
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._conn.execute("PRAGMA cache_size=-65536")  # 64MB page cache
+        self._conn.execute("PRAGMA wal_autocheckpoint=1000")
+        try:
+            self._conn.execute("PRAGMA mmap_size=268435456")  # 256MB
+        except sqlite3.Error:
+            pass  # Some platforms refuse mmap; purely an optimization
         self._conn.executescript(_CREATE_TABLE_SQL)
         self._conn.commit()
+        # Reader pool, opened after the writer has set WAL and the schema
+        self._readers = queue.Queue()
+        for _ in range(_READER_POOL_SIZE):
+            reader = sqlite3.connect(
+                str(self.db_path), check_same_thread=False, cached_statements=256
+            )
+            reader.row_factory = sqlite3.Row
+            reader.execute("PRAGMA query_only=1")
+            self._readers.put(reader)
 
     def close(self) -> None:
-        """Close the database connection."""
+        """Close the database connections, flushing any queued writes."""
         if self._conn:
+            self.flush()
             self._conn.close()
             self._conn = None
+        if self._readers is not None:
+            while not self._readers.empty():
+                self._readers.get_nowait().close()
+            self._readers = None
 
     def __enter__(self) -> "Database":
         self.connect()
@@ -90,6 +233,87 @@ class Database:
             raise RuntimeError("Database not connected. Call connect() first.")
         return self._conn
 
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a read-only connection from the pool."""
+        if self._readers is None:
+            raise RuntimeError("Database not connected. Call connect() first.")
+        conn = self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+
+    # -------------------------------------------------------------------------
+    # Write queue
+    #
+    # UI writes (viewed, rating, thumbnail path) arrive one at a time during a
+    # slideshow or thumbnail session; committing each individually means one
+    # fsync per keypress. They are queued here and flushed in one transaction
+    # once enough accumulate, before any read, and on close().
+    # -------------------------------------------------------------------------
+
+    def flush(self) -> None:
+        """Flush all queued writes to the database in a single transaction."""
+        # Swap the containers out under the lock before executing: draining
+        # the live ones would lose an append that lands between executemany
+        # and clear(), and iterating a dict the main thread is writing to
+        # raises RuntimeError
+        with self._pending_lock:
+            views, self._pending_views = self._pending_views, []
+            ratings, self._pending_ratings = self._pending_ratings, {}
+            thumbs, self._pending_thumbs = self._pending_thumbs, {}
+        if not (views or ratings or thumbs):
+            return
+        with self.conn:
+            if views:
+                self.conn.executemany(_SQL_MARK_VIEWED, views)
+            if ratings:
+                self.conn.executemany(
+                    _SQL_UPDATE_RATING,
+                    [(r, fp) for fp, r in ratings.items()],
+                )
+            if thumbs:
+                self.conn.executemany(
+                    _SQL_SET_THUMBNAIL,
+                    [(cp, fp) for fp, cp in thumbs.items()],
+                )
+
+    def _maybe_flush(self) -> None:
+        """Flush if the queue has grown past the batching threshold."""
+        pending = (
+            len(self._pending_views)
+            + len(self._pending_ratings)
+            + len(self._pending_thumbs)
+        )
+        if pending >= _FLUSH_THRESHOLD:
+            self.flush()
+
+    def is_empty(self) -> bool:
+        """Return True if no image rows exist yet (i.e. this is a first scan)."""
+        return self.conn.execute("SELECT 1 FROM images LIMIT 1").fetchone() is None
+
+    @contextmanager
+    def bulk_mode(self) -> Iterator[None]:
+        """Drop secondary indexes around a large ingest, rebuilding them after.
+
+        Every INSERT otherwise updates each secondary B-tree; for a first-time
+        scan it is cheaper to build them once over the finished table. The
+        filepath autoindex and thumbnail covering index stay — the upsert's
+        conflict detection and the INDEXED BY lookup need them.
+        """
+        self.flush()
+        for name in _BULK_DROP_INDEXES:
+            self.conn.execute(f"DROP INDEX IF EXISTS {name}")
+        self.conn.commit()
+        try:
+            yield
+        finally:
+            self.flush()
+            # The schema script's IF NOT EXISTS clauses rebuild what we dropped
+            self.conn.executescript(_CREATE_TABLE_SQL)
+            self.conn.commit()
+
     # -------------------------------------------------------------------------
     # Image CRUD
     # -------------------------------------------------------------------------
@@ -113,37 +337,55 @@ class Database:
         if not images:
             return images
 
-        sql = """
-        INSERT INTO images
-            (filepath, filename, directory, file_size, file_modified,
-             rating, viewed, view_count, last_viewed, first_seen)
-        VALUES
-            (:filepath, :filename, :directory, :file_size, :file_modified,
-             :rating, :viewed, :view_count, :last_viewed, :first_seen)
-        ON CONFLICT(filepath) DO UPDATE SET
-            filename = excluded.filename,
-            directory = excluded.directory,
-            file_size = excluded.file_size,
-            file_modified = excluded.file_modified
-        """
-        params = [
-            {
-                "filepath": img.filepath,
-                "filename": img.filename,
-                "directory": img.directory,
-                "file_size": img.file_size,
-                "file_modified": img.file_modified,
-                "rating": img.rating,
-                "viewed": int(img.viewed),
-                "view_count": img.view_count,
-                "last_viewed": img.last_viewed,
-                "first_seen": img.first_seen,
-            }
+        self.flush()  # The RETURNING readback must observe queued UI writes
+        if sqlite3.sqlite_version_info >= (3, 35, 0):
+            return self._batch_upsert_returning(images)
+        return self._batch_upsert_legacy(images)
+
+    def _batch_upsert_returning(self, images: list[ImageInfo]) -> list[ImageInfo]:
+        """Upsert in multi-row VALUES chunks, reading state back via RETURNING."""
+        with self.conn:  # Single transaction for all upserts
+            for start in range(0, len(images), _UPSERT_CHUNK):
+                chunk = images[start:start + _UPSERT_CHUNK]
+                params = list(itertools.chain.from_iterable(
+                    (
+                        img.filepath, img.filename, img.directory,
+                        img.file_size, img.file_modified,
+                        img.rating, int(img.viewed), img.view_count,
+                        img.last_viewed, img.first_seen,
+                    )
+                    for img in chunk
+                ))
+                rows = self.conn.execute(
+                    _upsert_returning_sql(len(chunk)), params
+                ).fetchall()
+                # RETURNING row order is unspecified; match rows back by path
+                by_path = {row["filepath"]: row for row in rows}
+                for img in chunk:
+                    row = by_path[img.filepath]
+                    img.db_id = row["id"]
+                    img.rating = row["rating"]
+                    img.viewed = bool(row["viewed"])
+                    img.view_count = row["view_count"]
+                    img.last_viewed = row["last_viewed"]
+        return images
+
+    def _batch_upsert_legacy(self, images: list[ImageInfo]) -> list[ImageInfo]:
+        """Upsert via executemany + re-SELECT, for SQLite without RETURNING."""
+        # Positional tuples (via a generator) rather than one 10-key dict per
+        # image: cheaper to build and the driver binds them without name lookups
+        params = (
+            (
+                img.filepath, img.filename, img.directory,
+                img.file_size, img.file_modified,
+                img.rating, int(img.viewed), img.view_count,
+                img.last_viewed, img.first_seen,
+            )
             for img in images
-        ]
+        )
 
         with self.conn:  # Single transaction for all inserts
-            self.conn.executemany(sql, params)
+            self.conn.executemany(_SQL_UPSERT, params)
 
         # Fetch all rows back in one query to get ids and preserved metadata
         filepaths = [img.filepath for img in images]
@@ -169,64 +411,67 @@ class Database:
 
     def get_image(self, filepath: str) -> Optional[ImageInfo]:
         """Fetch a single image by filepath."""
-        row = self.conn.execute(
-            "SELECT * FROM images WHERE filepath = ?", (filepath,)
-        ).fetchone()
+        self.flush()  # Reads must observe queued writes
+        with self.reader() as conn:
+            row = conn.execute(_SQL_GET_IMAGE, (filepath,)).fetchone()
         return self._row_to_image(row) if row else None
 
     def get_all_images(self) -> list[ImageInfo]:
         """Fetch all images in the database."""
-        rows = self.conn.execute("SELECT * FROM images").fetchall()
+        self.flush()  # Reads must observe queued writes
+        with self.reader() as conn:
+            rows = conn.execute(_SQL_GET_ALL_IMAGES).fetchall()
         return [self._row_to_image(r) for r in rows]
 
     def update_rating(self, filepath: str, rating: int) -> None:
-        """Update the rating for an image. Rating is clamped to 0-5."""
-        rating = max(0, min(5, rating))
-        self.conn.execute(
-            "UPDATE images SET rating = ? WHERE filepath = ?",
-            (rating, filepath),
-        )
-        self.conn.commit()
+        """Update the rating for an image. Rating is clamped to 0-5.
+
+        The write is queued; only the latest rating per filepath is kept.
+        """
+        with self._pending_lock:
+            self._pending_ratings[filepath] = max(0, min(5, rating))
+        self._maybe_flush()
 
     def mark_viewed(self, filepath: str) -> None:
-        """Mark an image as viewed, incrementing view_count and updating timestamps."""
-        now = time.time()
-        self.conn.execute(
-            """
-            UPDATE images
-            SET viewed = 1,
-                view_count = view_count + 1,
-                last_viewed = ?
-            WHERE filepath = ?
-            """,
-            (now, filepath),
-        )
-        self.conn.commit()
+        """Mark an image as viewed, incrementing view_count and updating timestamps.
+
+        The write is queued; each call becomes one view_count increment at flush.
+        """
+        with self._pending_lock:
+            self._pending_views.append((time.time(), filepath))
+        self._maybe_flush()
 
     def delete_image(self, filepath: str) -> None:
         """Delete an image record from the database."""
-        self.conn.execute(
-            "DELETE FROM images WHERE filepath = ?",
-            (filepath,),
-        )
+        self.flush()  # Don't let a queued write resurrect the row
+        self._thumb_lru.pop(filepath, None)
+        self.conn.execute(_SQL_DELETE_IMAGE, (filepath,))
         self.conn.commit()
 
     def set_thumbnail_cache(self, filepath: str, cache_path: str) -> None:
-        """Store the path to a cached thumbnail."""
-        self.conn.execute(
-            "UPDATE images SET thumbnail_cache = ? WHERE filepath = ?",
-            (cache_path, filepath),
-        )
-        self.conn.commit()
+        """Store the path to a cached thumbnail. The write is queued."""
+        with self._pending_lock:
+            self._pending_thumbs[filepath] = cache_path
+        self._thumb_lru[filepath] = cache_path  # Write through
+        self._thumb_lru.move_to_end(filepath)
+        self._maybe_flush()
 
     def get_thumbnail_cache(self, filepath: str) -> Optional[str]:
         """Get the cached thumbnail path for an image, or None."""
-        row = self.conn.execute(
-            "SELECT thumbnail_cache FROM images WHERE filepath = ?", (filepath,)
-        ).fetchone()
-        if row and row["thumbnail_cache"]:
-            return row["thumbnail_cache"]
-        return None
+        lru = self._thumb_lru
+        if filepath in lru:
+            lru.move_to_end(filepath)
+            return lru[filepath]
+        pending = self._pending_thumbs.get(filepath)
+        if pending is not None:
+            return pending
+        with self.reader() as conn:
+            row = conn.execute(_SQL_GET_THUMBNAIL, (filepath,)).fetchone()
+        result = row["thumbnail_cache"] if row and row["thumbnail_cache"] else None
+        lru[filepath] = result
+        if len(lru) > _THUMB_CACHE_MAX:
+            lru.popitem(last=False)
+        return result
 
     # -------------------------------------------------------------------------
     # Helpers
@@ -250,6 +495,21 @@ class Database:
         )
 
 
+@functools.lru_cache(maxsize=32)
+def _get_database(base_dir: str) -> Database:
+    """Return a connected Database for base_dir, shared process-wide.
+
+    Constructing a fresh Database per MultiDatabase re-ran the schema script
+    and PRAGMAs and reopened every connection; caching keeps one live
+    instance per base_dir for the life of the process. Connections are
+    closed (flushing queued writes) at interpreter exit.
+    """
+    db = Database(base_dir)
+    db.connect()
+    atexit.register(db.close)
+    return db
+
+
 class MultiDatabase:
     """Manages multiple Database instances for multiple root paths.
 
@@ -259,16 +519,41 @@ class MultiDatabase:
     def __init__(self, base_dirs: list[str]) -> None:
         self._dbs: dict[str, Database] = {}
         for d in base_dirs:
-            d = os.path.abspath(d)
-            self._dbs[d] = Database(d)
+            if not os.path.isabs(d):
+                d = os.path.abspath(d)
+            self._dbs[d] = _get_database(d)
+        # Longest base first: the first prefix hit in _db_for is the best match
+        self._bases_with_sep: list[tuple[str, Database]] = sorted(
+            ((base + os.sep, db) for base, db in self._dbs.items()),
+            key=lambda pair: len(pair[0]),
+            reverse=True,
+        )
+        # Directory -> Database memo; images arrive grouped by directory, so
+        # routing repeats the same lookup thousands of times during a scan
+        self._dir_cache: dict[str, Database] = {}
 
     def connect(self) -> None:
         for db in self._dbs.values():
-            db.connect()
+            db.connect()  # No-op for already-live shared instances
 
     def close(self) -> None:
+        # The underlying databases are shared via _get_database and stay open
+        # for the process; just make sure queued writes are durable
+        self.flush()
+
+    def flush(self) -> None:
+        """Flush queued writes on all databases."""
         for db in self._dbs.values():
-            db.close()
+            db.flush()
+
+    @contextmanager
+    def bulk_mode(self) -> Iterator[None]:
+        """Enter bulk_mode on every database that is still empty."""
+        with ExitStack() as stack:
+            for db in self._dbs.values():
+                if db.is_empty():
+                    stack.enter_context(db.bulk_mode())
+            yield
 
     def __enter__(self) -> "MultiDatabase":
         self.connect()
@@ -278,20 +563,14 @@ class MultiDatabase:
         self.close()
 
     def _db_for(self, filepath: str) -> Database:
-        """Find the appropriate database for a given filepath."""
-        filepath = os.path.abspath(filepath)
-        # Find the db whose base_dir is the longest prefix of filepath
-        best: Optional[Database] = None
-        best_len = -1
-        for base_dir, db in self._dbs.items():
-            if filepath.startswith(base_dir + os.sep) or filepath == base_dir:
-                if len(base_dir) > best_len:
-                    best = db
-                    best_len = len(base_dir)
-        if best is None:
-            # Fall back to first db
-            best = next(iter(self._dbs.values()))
-        return best
+        """Find the database whose base_dir is the longest prefix of filepath."""
+        if not os.path.isabs(filepath):  # Scanner paths are already absolute
+            filepath = os.path.abspath(filepath)
+        for base_sep, db in self._bases_with_sep:
+            if filepath.startswith(base_sep) or filepath == base_sep[:-1]:
+                return db
+        # Fall back to first db
+        return next(iter(self._dbs.values()))
 
     def upsert_image(self, image: ImageInfo) -> ImageInfo:
         return self._db_for(image.filepath).upsert_image(image)
@@ -300,20 +579,21 @@ class MultiDatabase:
         """Batch upsert images, routing each to the correct database."""
         if not images:
             return images
-        # Group images by their target database
-        groups: dict[str, list[ImageInfo]] = {}
+        # Group images by their target database in one pass; route via the
+        # directory memo so siblings resolve with one dict probe instead of a
+        # prefix scan. dicts preserve insertion order, so iterating the
+        # groups keeps first-seen order within and across databases.
+        groups: defaultdict[Database, list[ImageInfo]] = defaultdict(list)
+        dir_cache = self._dir_cache
         for img in images:
-            db = self._db_for(img.filepath)
-            key = str(db.db_path)
-            if key not in groups:
-                groups[key] = []
-            groups[key].append(img)
-        # Batch upsert each group
-        result = []
-        for db in self._dbs.values():
-            key = str(db.db_path)
-            if key in groups:
-                result.extend(db.batch_upsert_images(groups[key]))
+            db = dir_cache.get(img.directory)
+            if db is None:
+                db = self._db_for(img.filepath)
+                dir_cache[img.directory] = db
+            groups[db].append(img)
+        result: list[ImageInfo] = []
+        for db, group in groups.items():
+            result.extend(db.batch_upsert_images(group))
         return result
 
     def get_image(self, filepath: str) -> Optional[ImageInfo]:
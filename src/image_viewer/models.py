@@ -12,8 +12,12 @@ SUPPORTED_EXTENSIONS: frozenset[str] = frozenset({
     ".jpg", ".jpeg", ".png", ".gif", ".bmp", ".webp",
 })
 
+# Tuple form for str.endswith, which matches all suffixes in one C call —
+# cheaper than splitext + set membership on the scanner's per-file path
+SUPPORTED_SUFFIXES: tuple[str, ...] = tuple(SUPPORTED_EXTENSIONS)
 
-@dataclass
+
+@dataclass(slots=True)
 class ImageInfo:
     """Represents a single image with its metadata, rating, and viewed status."""
 
@@ -36,11 +40,23 @@ class ImageInfo:
     # Internal
     db_id: Optional[int] = None  # SQLite row ID (None if not yet persisted)
 
+    # Derived sort keys, computed once at construction: the sort strategies
+    # in sorting.py compare these instead of calling .lower() per element
+    filename_lower: str = field(init=False, default="")
+    directory_lower: str = field(init=False, default="")
+    filepath_lower: str = field(init=False, default="")
+
+    def __post_init__(self) -> None:
+        self.filename_lower = self.filename.lower()
+        self.directory_lower = self.directory.lower()
+        self.filepath_lower = self.filepath.lower()
+
     @classmethod
     def from_path(cls, filepath: str) -> "ImageInfo":
         """Create an ImageInfo from a file path, reading file metadata."""
         import time
-        filepath = os.path.abspath(filepath)
+        if not os.path.isabs(filepath):  # Scanner paths are already absolute
+            filepath = os.path.abspath(filepath)
         stat = os.stat(filepath)
         return cls(
             filepath=filepath,
@@ -73,7 +89,7 @@ class ImageInfo:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AppConfig:
     """Application configuration, merged from config file and CLI arguments."""
 
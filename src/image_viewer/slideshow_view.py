@@ -15,21 +15,108 @@ from __future__ import annotations
 
 import random
 import time
-from typing import Optional, TYPE_CHECKING
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, ClassVar, Optional, TYPE_CHECKING
 
 import gi
 gi.require_version("Gtk", "4.0")
 from gi.repository import Gtk, GLib, Gdk, GdkPixbuf
 
+from .config import save_config
 from .models import AppConfig, ImageInfo
 
 if TYPE_CHECKING:
     from .app import MainWindow, ImageViewerApp
 
+# Decoded-pixbuf LRU size: current image plus a few neighbors in each
+# direction is all prefetch ever needs
+_PIXBUF_CACHE_MAX = 8
+
+
+def _decode_scaled(filepath: str, max_width: int, max_height: int) -> GdkPixbuf.Pixbuf:
+    """Decode an image pre-scaled to fit within max_width x max_height.
+
+    A PixbufLoader with a size-prepared hook tells the codec the target size
+    before decoding starts, so libjpeg's IDCT scaling can emit a downscaled
+    buffer directly instead of decoding every full-resolution pixel and
+    shrinking afterwards. Runs on a decode worker thread.
+    """
+    loader = GdkPixbuf.PixbufLoader()
+
+    def on_size_prepared(ldr: GdkPixbuf.PixbufLoader, width: int, height: int) -> None:
+        scale = min(max_width / width, max_height / height, 1.0)
+        ldr.set_size(max(1, int(width * scale)), max(1, int(height * scale)))
+
+    loader.connect("size-prepared", on_size_prepared)
+    try:
+        with open(filepath, "rb") as f:
+            while chunk := f.read(65536):
+                loader.write(chunk)
+    finally:
+        loader.close()
+    pixbuf = loader.get_pixbuf()
+    if pixbuf is None:
+        raise RuntimeError("no pixbuf produced")
+    return pixbuf
+
+
+# Star strings indexed by rating, and order glyphs, built once instead of
+# re-concatenated (or re-allocated as a dict literal) on every info refresh
+_STARS = tuple("★" * r + "☆" * (5 - r) for r in range(6))
+
+# Ready-made rating notification texts: holding Numpad +/- fires the
+# notification up to key-repeat rate, so skip per-call formatting entirely
+_RATING_NOTIFS = tuple(f"Rating: {stars}" for stars in _STARS)
+_ORDER_GLYPH = {"forward": "→", "backward": "←", "random": "⇄"}
+
+# Pre-encoded so provider setup doesn't re-encode per instance
+_CSS = b"""
+.slideshow-image {
+    background-color: black;
+}
+.slideshow-info-bar {
+    background-color: alpha(black, 0.6);
+    border-radius: 6px;
+    padding: 4px 8px;
+    color: white;
+}
+.slideshow-rating {
+    color: #f0a500;
+    font-size: 16px;
+}
+.rating-notification {
+    background-color: alpha(black, 0.75);
+    color: white;
+    font-size: 32px;
+    border-radius: 12px;
+    padding: 16px 24px;
+}
+.paused-indicator {
+    background-color: alpha(black, 0.5);
+    color: white;
+    font-size: 14px;
+    border-radius: 4px;
+    padding: 4px 8px;
+}
+.slideshow-controls {
+    background-color: alpha(black, 0.8);
+    padding: 8px 12px;
+    border-radius: 8px;
+}
+.control-btn {
+    min-width: 36px;
+}
+"""
+
 
 class SlideshowView(Gtk.Overlay):
     """Full-window slideshow view with overlay notifications."""
 
+    # CSS provider shared by every instance; parsing the stylesheet and
+    # re-cascading the display's widgets should happen once per process
+    _css_provider: ClassVar[Optional[Gtk.CssProvider]] = None
+
     def __init__(
         self,
         window: "MainWindow",
@@ -46,16 +133,40 @@ class SlideshowView(Gtk.Overlay):
         self._playing: bool = False
         self._advance_timer_id: Optional[int] = None
         self._viewed_timer_id: Optional[int] = None
+        self._viewed_timer_path: Optional[str] = None
         self._display_start_time: float = 0.0
 
         # Sticky window size for zoom-to-fit
         self._display_width: int = 1200
         self._display_height: int = 800
 
+        # Resize debounce: re-decode once at the final size instead of on
+        # every allocate during an interactive drag
+        self._resize_timer_id: Optional[int] = None
+        self._pending_size: tuple[int, int] = (1200, 800)
+
+        # Config-save debounce: dragging the time slider fires value-changed
+        # continuously, but only the settled value needs to hit disk
+        self._save_timer_id: Optional[int] = None
+
         # Random order history (for random mode without immediate repeats)
         self._random_history: list[int] = []
         self._random_pos: int = -1
 
+        # Background decoding: workers decode off the main thread so large
+        # JPEGs don't stall the event loop, and neighbors are prefetched so
+        # the next image is usually ready before it's asked for
+        self._decode_pool = ThreadPoolExecutor(max_workers=2)
+        self._pixbuf_cache: OrderedDict[str, GdkPixbuf.Pixbuf] = OrderedDict()
+        self._pending: dict[str, Future] = {}
+
+        # Last-rendered strings: setting an unchanged label still costs a
+        # GObject property set plus Pango relayout, so skip those
+        self._last_info: str = ""
+        self._last_rating: str = ""
+        self._last_play: str = ""
+        self._last_title: str = ""
+
         # ---- Main image display ----
         self._picture = Gtk.Picture()
         self._picture.set_content_fit(Gtk.ContentFit.CONTAIN)
@@ -68,12 +179,15 @@ class SlideshowView(Gtk.Overlay):
         # ---- Controls bar (bottom) ----
         self._controls_bar = self._build_controls_bar()
 
-        # Stack for picture + controls
-        self._stack = Gtk.Stack()
-        self._stack.add_named(self._picture, "picture")
-        self._stack.add_named(self._controls_bar, "controls")
-        self._stack.set_visible_child(self._picture)
-        self.set_child(self._stack)
+        # The picture is the overlay's direct child: an intermediate Gtk.Stack
+        # here only added measure/allocate work to every resize and crossfade
+        # setup to switches, since the controls were never shown through it.
+        self.set_child(self._picture)
+
+        # Controls bar rides as an overlay instead; hidden until requested
+        self._controls_bar.set_valign(Gtk.Align.END)
+        self._controls_bar.set_visible(False)
+        self.add_overlay(self._controls_bar)
 
         # ---- Info bar (bottom) ----
         self._info_bar = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
@@ -127,50 +241,16 @@ class SlideshowView(Gtk.Overlay):
         self._apply_css()
 
     def _apply_css(self) -> None:
-        css = """
-        .slideshow-image {
-            background-color: black;
-        }
-        .slideshow-info-bar {
-            background-color: alpha(black, 0.6);
-            border-radius: 6px;
-            padding: 4px 8px;
-            color: white;
-        }
-        .slideshow-rating {
-            color: #f0a500;
-            font-size: 16px;
-        }
-        .rating-notification {
-            background-color: alpha(black, 0.75);
-            color: white;
-            font-size: 32px;
-            border-radius: 12px;
-            padding: 16px 24px;
-        }
-        .paused-indicator {
-            background-color: alpha(black, 0.5);
-            color: white;
-            font-size: 14px;
-            border-radius: 4px;
-            padding: 4px 8px;
-        }
-        .slideshow-controls {
-            background-color: alpha(black, 0.8);
-            padding: 8px 12px;
-            border-radius: 8px;
-        }
-        .control-btn {
-            min-width: 36px;
-        }
-        """
+        if SlideshowView._css_provider is not None:
+            return
         provider = Gtk.CssProvider()
-        provider.load_from_data(css.encode())
+        provider.load_from_data(_CSS)
         Gtk.StyleContext.add_provider_for_display(
             Gdk.Display.get_default(),
             provider,
             Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION,
         )
+        SlideshowView._css_provider = provider
 
     def _build_controls_bar(self) -> Gtk.Box:
         """Build the bottom controls bar for slideshow."""
@@ -273,14 +353,28 @@ class SlideshowView(Gtk.Overlay):
 
     def _on_time_changed(self, scale: Gtk.Scale) -> None:
         """Handle time scale change."""
-        from .config import save_config
         self._config.slideshow_time = scale.get_value()
         self._time_label.set_label(f"{self._config.slideshow_time:.1f}s")
         self._update_info_bar()
+        self._schedule_save()
+
+    def _schedule_save(self) -> None:
+        """Save the config 500ms after the last change, not on every tick."""
+        if self._save_timer_id is not None:
+            GLib.source_remove(self._save_timer_id)
+        self._save_timer_id = GLib.timeout_add(500, self._do_save)
+
+    def _do_save(self) -> bool:
+        self._save_timer_id = None
         save_config(self._config)
+        return False
 
     def _on_back_clicked(self, btn: Gtk.Button) -> None:
         """Handle back to thumbnails button click."""
+        self._back_to_thumbnails()
+
+    def _back_to_thumbnails(self) -> None:
+        """Leave the slideshow and return to the thumbnail view."""
         self._stop_advance()
         if self._window.is_fullscreen():
             self._window.unfullscreen()
@@ -303,12 +397,31 @@ class SlideshowView(Gtk.Overlay):
         self._show_current()
 
     def on_window_resized(self, width: int, height: int) -> None:
-        """Called when the window is resized. Updates sticky display size."""
-        self._display_width = width
-        self._display_height = height
+        """Called when the window is resized. Debounces the re-decode."""
+        if (width, height) == (self._display_width, self._display_height):
+            # Spurious allocate (window move, no real size change): drop any
+            # pending re-decode instead of scheduling one
+            if self._resize_timer_id is not None:
+                GLib.source_remove(self._resize_timer_id)
+                self._resize_timer_id = None
+            return
+        self._pending_size = (width, height)
+        if self._resize_timer_id is not None:
+            GLib.source_remove(self._resize_timer_id)
+        self._resize_timer_id = GLib.timeout_add(80, self._apply_resize)
+
+    def _apply_resize(self) -> bool:
+        """Adopt the last-seen size and re-display once the resize settles."""
+        self._resize_timer_id = None
+        if self._pending_size == (self._display_width, self._display_height):
+            return False  # Drag ended back where it started
+        self._display_width, self._display_height = self._pending_size
+        # Cached pixbufs were decoded for the old size
+        self._pixbuf_cache.clear()
         # Re-display current image at new size
         if self._images:
             self._show_current()
+        return False
 
     # -------------------------------------------------------------------------
     # Navigation
@@ -326,25 +439,90 @@ class SlideshowView(Gtk.Overlay):
         self._display_start_time = time.time()
 
         # Update window title
-        self._window.set_title(
+        title = (
             f"image-viewer — {img.filename} "
             f"[{self._current_index + 1}/{len(self._images)}]"
         )
+        if title != self._last_title:
+            self._last_title = title
+            self._window.set_title(title)
 
     def _load_image(self, img: ImageInfo) -> None:
-        """Load and display an image, scaled to fit the display size."""
-        try:
-            pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(
-                img.filepath,
-                self._display_width,
-                self._display_height,
-                True,  # preserve aspect ratio
-            )
+        """Display an image, decoding off the main thread and prefetching neighbors."""
+        # Rapid navigation leaves decodes queued for images already skipped
+        # past; cancel whatever fell out of the prefetch window. Futures that
+        # are mid-decode can't be cancelled and simply land in the LRU.
+        wanted = {img.filepath, *self._prefetch_paths()}
+        for path in list(self._pending):
+            if path not in wanted and self._pending[path].cancel():
+                del self._pending[path]
+
+        pixbuf = self._pixbuf_cache.get(img.filepath)
+        if pixbuf is not None:
+            self._pixbuf_cache.move_to_end(img.filepath)
             self._picture.set_pixbuf(pixbuf)
+        else:
+            # No prefetched decode available: hand the file straight to GTK.
+            # set_filename streams via GdkTexture/GdkPaintable with CONTAIN
+            # scaling, skipping the Python-side pixbuf round-trip entirely,
+            # so the image appears immediately instead of after a pool decode.
+            try:
+                self._picture.set_filename(img.filepath)
+            except Exception as e:
+                print(f"Error loading image {img.filepath}: {e}")
+                self._picture.set_pixbuf(None)
+        # Warm the images most likely to be shown next
+        for neighbor in self._prefetch_paths():
+            if neighbor not in self._pixbuf_cache:
+                self._request_decode(neighbor)
+
+    def _prefetch_paths(self) -> list[str]:
+        """Paths adjacent to the current image, in likely-next order."""
+        n = len(self._images)
+        if n < 2:
+            return []
+        cur = self._current_index
+        return [
+            self._images[(cur + 1) % n].filepath,
+            self._images[(cur - 1) % n].filepath,
+        ]
+
+    def _request_decode(self, filepath: str) -> None:
+        """Submit a decode to the worker pool unless one is already in flight."""
+        if filepath in self._pending:
+            return
+        future = self._decode_pool.submit(
+            _decode_scaled, filepath, self._display_width, self._display_height
+        )
+        self._pending[filepath] = future
+
+        def on_done(fut: Future, path: str = filepath) -> None:
+            if not fut.cancelled():  # Cancelled decodes have nothing to install
+                GLib.idle_add(self._install_pixbuf, path, fut)
+
+        future.add_done_callback(on_done)
+
+    def _install_pixbuf(self, filepath: str, future: Future) -> bool:
+        """Main-thread landing point for a finished decode."""
+        self._pending.pop(filepath, None)
+        is_current = bool(
+            self._images
+            and filepath == self._images[self._current_index].filepath
+        )
+        try:
+            pixbuf = future.result()
         except Exception as e:
-            # Show error placeholder
-            self._picture.set_pixbuf(None)
-            print(f"Error loading image {img.filepath}: {e}")
+            if is_current:
+                # Show error placeholder
+                self._picture.set_pixbuf(None)
+            print(f"Error loading image {filepath}: {e}")
+            return False
+        self._pixbuf_cache[filepath] = pixbuf
+        if len(self._pixbuf_cache) > _PIXBUF_CACHE_MAX:
+            self._pixbuf_cache.popitem(last=False)
+        if is_current:
+            self._picture.set_pixbuf(pixbuf)
+        return False
 
     def _go_next(self) -> None:
         """Advance to the next image."""
@@ -398,21 +576,18 @@ class SlideshowView(Gtk.Overlay):
             self._random_pos += 1
             self._current_index = self._random_history[self._random_pos]
         else:
-            # Pick a new random index (avoid immediate repeat)
-            candidates = [
-                i for i in range(len(self._images))
-                if i != self._current_index
-            ]
-            if not candidates:
-                return
-            new_index = random.choice(candidates)
+            # Pick a random index avoiding an immediate repeat: draw from a
+            # range one short and shift past the current index, so no O(N)
+            # candidate list is built
+            n = len(self._images)
+            new_index = random.randrange(n - 1)
+            if new_index >= self._current_index:
+                new_index += 1
             self._random_history.append(new_index)
-            # Trim history to avoid unbounded growth
+            # Trim history in place to avoid unbounded growth
             if len(self._random_history) > 200:
-                self._random_history = self._random_history[-100:]
-                self._random_pos = len(self._random_history) - 1
-            else:
-                self._random_pos = len(self._random_history) - 1
+                del self._random_history[:-100]
+            self._random_pos = len(self._random_history) - 1
             self._current_index = new_index
 
         self._show_current()
@@ -460,8 +635,25 @@ class SlideshowView(Gtk.Overlay):
         if not self._playing or not self._images:
             return
         img = self._images[self._current_index]
-        delay_ms = int(self._config.display_time_for(img.rating) * 1000)
-        self._advance_timer_id = GLib.timeout_add(delay_ms, self._on_advance_timer)
+        delay = self._config.display_time_for(img.rating)
+        # Credit time the current image has already spent on screen, so a
+        # manual Left/Right during playback doesn't restart a full interval
+        # and stretch the slideshow's configured pace. Sub-50ms elapsed means
+        # a fresh display (the normal auto-advance path): keep the exact
+        # whole-second delay so timeout_add_seconds wakeups still coalesce.
+        elapsed = time.time() - self._display_start_time
+        remaining = delay if elapsed < 0.05 else max(0.0, delay - elapsed)
+        if remaining == 0.0:
+            self._advance_timer_id = GLib.idle_add(self._on_advance_timer)
+        elif remaining >= 1.0 and remaining == int(remaining):
+            # Whole-second timeouts let the kernel coalesce timer wakeups
+            self._advance_timer_id = GLib.timeout_add_seconds(
+                int(remaining), self._on_advance_timer
+            )
+        else:
+            self._advance_timer_id = GLib.timeout_add(
+                int(remaining * 1000), self._on_advance_timer
+            )
 
     def _on_advance_timer(self) -> bool:
         """Called when the auto-advance timer fires."""
@@ -503,18 +695,26 @@ class SlideshowView(Gtk.Overlay):
 
     def _start_viewed_timer(self, img: ImageInfo) -> None:
         """Start a 1-second timer to mark the image as viewed."""
+        filepath = img.filepath
         if self._viewed_timer_id is not None:
+            if self._viewed_timer_path == filepath:
+                # Same image re-displayed (e.g. after a resize): the running
+                # source is still correct, no need to rebuild it
+                return
             GLib.source_remove(self._viewed_timer_id)
             self._viewed_timer_id = None
 
-        filepath = img.filepath
-        self._viewed_timer_id = GLib.timeout_add(
-            1000, self._on_viewed_timer, filepath
+        # PRIORITY_LOW: marking viewed a frame late is invisible, so don't
+        # compete with rendering for the main loop on a busy system
+        self._viewed_timer_path = filepath
+        self._viewed_timer_id = GLib.timeout_add_seconds(
+            1, self._on_viewed_timer, filepath, priority=GLib.PRIORITY_LOW
         )
 
     def _on_viewed_timer(self, filepath: str) -> bool:
         """Mark the image as viewed after 1 second of display."""
         self._viewed_timer_id = None
+        self._viewed_timer_path = None
         self._app.mark_viewed(filepath)
         return False
 
@@ -572,10 +772,17 @@ class SlideshowView(Gtk.Overlay):
             if self._app.db:
                 self._app.db.delete_image(img.filepath)
             
-            # Remove from images list
-            old_index = self._current_index
-            self._images.remove(img)
+            # Remove from images list by index: list.remove would linear-scan
+            # the whole library comparing dataclasses field by field
+            idx = self._current_index
+            if idx >= len(self._images) or self._images[idx] is not img:
+                idx = self._images.index(img)
+            del self._images[idx]
             self._app.images = self._images
+
+            # Random history holds indices into the list that just shifted
+            self._random_history = []
+            self._random_pos = -1
             
             # Update view
             if not self._images:
@@ -593,23 +800,61 @@ class SlideshowView(Gtk.Overlay):
 
     def _show_rating_notification(self, rating: int) -> None:
         """Show a brief overlay notification of the new rating."""
-        stars = "★" * rating + "☆" * (5 - rating)
-        self._notif_label.set_label(f"Rating: {stars}")
-        self._notif_label.set_visible(True)
+        self._post_notification(_RATING_NOTIFS[rating])
+
+    def _post_notification(self, text: str, timeout_ms: int = 1500) -> None:
+        """Show the overlay notification and (re)arm its hide timer.
+
+        The cancel-previous/schedule-new scaffolding lives only here, so two
+        overlapping notifications can't leak the earlier hide source.
+        """
+        self._notif_label.freeze_notify()
+        try:
+            self._notif_label.set_label(text)
+            self._notif_label.set_visible(True)
+        finally:
+            self._notif_label.thaw_notify()
 
-        # Cancel previous notification timer
         if self._notif_timer_id is not None:
             GLib.source_remove(self._notif_timer_id)
-
+            self._notif_timer_id = None
+        # Hiding a decoration late is harmless, so run below render priority
         self._notif_timer_id = GLib.timeout_add(
-            1500, self._hide_rating_notification
+            timeout_ms, self._hide_rating_notification, priority=GLib.PRIORITY_LOW
         )
 
     def _hide_rating_notification(self) -> bool:
+        # Clear the id before touching the label so a concurrent cleanup()
+        # can't remove a source that already fired
         self._notif_timer_id = None
         self._notif_label.set_visible(False)
         return False
 
+    def _toggle_loop(self) -> None:
+        """Toggle loop mode (keyboard shortcut)."""
+        self._config.loop = not self._config.loop
+        self._update_info_bar()
+        self._show_notification(f"Loop: {'ON' if self._config.loop else 'OFF'}")
+
+    def _toggle_fullscreen(self) -> None:
+        """Toggle fullscreen (keyboard shortcut)."""
+        if self._window.is_fullscreen():
+            self._window.unfullscreen()
+        else:
+            self._window.fullscreen()
+
+    def _go_first(self) -> None:
+        """Jump to the first image."""
+        self._reset_advance_timer()
+        self._current_index = 0
+        self._show_current()
+
+    def _go_last(self) -> None:
+        """Jump to the last image."""
+        self._reset_advance_timer()
+        self._current_index = len(self._images) - 1
+        self._show_current()
+
     def _cycle_order(self) -> None:
         """Cycle slideshow order: forward -> backward -> random -> forward."""
         orders = ["forward", "backward", "random"]
@@ -628,27 +873,17 @@ class SlideshowView(Gtk.Overlay):
 
     def _adjust_slideshow_time(self, delta: float) -> None:
         """Adjust base slideshow time by delta seconds and save to config."""
-        from .config import save_config
         self._config.slideshow_time = max(0.5, self._config.slideshow_time + delta)
         self._update_info_bar()
         self._show_notification(f"Time: {self._config.slideshow_time:.1f}s")
         # Update the time scale to reflect the change
         self._time_scale.set_value(self._config.slideshow_time)
-        # Save to config file
-        save_config(self._config)
+        # Save to config file (debounced, in case the key is held down)
+        self._schedule_save()
 
     def _show_notification(self, message: str) -> None:
         """Show a brief overlay notification."""
-        self._notif_label.set_label(message)
-        self._notif_label.set_visible(True)
-
-        # Cancel previous notification timer
-        if self._notif_timer_id is not None:
-            GLib.source_remove(self._notif_timer_id)
-
-        self._notif_timer_id = GLib.timeout_add(
-            1500, self._hide_rating_notification
-        )
+        self._post_notification(message)
 
     # -------------------------------------------------------------------------
     # UI updates
@@ -663,25 +898,41 @@ class SlideshowView(Gtk.Overlay):
         idx = self._current_index + 1
 
         viewed_str = "✓" if img.viewed else "○"
-        self._info_label.set_label(
-            f"{idx}/{total}  {img.filename}  {viewed_str}"
-        )
+        info = f"{idx}/{total}  {img.filename}  {viewed_str}"
 
-        stars = "★" * img.rating + "☆" * (5 - img.rating)
-        self._rating_label.set_label(stars)
+        stars = _STARS[img.rating]
 
         play_str = "▶" if self._playing else "⏸"
-        order_str = {"forward": "→", "backward": "←", "random": "⇄"}.get(
-            self._config.slideshow_order, "→"
-        )
+        order_str = _ORDER_GLYPH.get(self._config.slideshow_order, "→")
         loop_str = "↺" if self._config.loop else ""
         time_str = f"{self._config.slideshow_time:.1f}s"
-        self._play_label.set_label(f"{play_str} {order_str} {loop_str} {time_str}")
+        play = f"{play_str} {order_str} {loop_str} {time_str}"
+
+        # Freeze notifications so the (up to) three label changes cascade
+        # through style and size negotiation as one pass instead of three
+        self._info_bar.freeze_notify()
+        try:
+            if info != self._last_info:
+                self._last_info = info
+                self._info_label.set_label(info)
+            if stars != self._last_rating:
+                self._last_rating = stars
+                self._rating_label.set_label(stars)
+            if play != self._last_play:
+                self._last_play = play
+                self._play_label.set_label(play)
+        finally:
+            self._info_bar.thaw_notify()
 
     # -------------------------------------------------------------------------
     # Keyboard handling
     # -------------------------------------------------------------------------
 
+    # Keyval -> action table, filled in after the class body (the handlers
+    # need the method objects to exist). Dispatch is one dict probe per
+    # keypress instead of a ~20-branch elif chain re-reading Gdk.KEY_*.
+    _KEY_TABLE: ClassVar[dict[int, Callable[["SlideshowView"], None]]] = {}
+
     def _on_key_pressed(
         self,
         controller: Gtk.EventControllerKey,
@@ -690,98 +941,12 @@ class SlideshowView(Gtk.Overlay):
         state: Gdk.ModifierType,
     ) -> bool:
         """Handle keyboard input in slideshow mode."""
-
-        # Navigation - arrow keys and numpad
-        if keyval in (Gdk.KEY_Right, Gdk.KEY_KP_6):
-            self._reset_advance_timer()
-            self._go_next()
-            return True
-        elif keyval in (Gdk.KEY_Left, Gdk.KEY_BackSpace, Gdk.KEY_KP_4):
-            self._reset_advance_timer()
-            self._go_prev()
-            return True
-
-        # Play/pause (spacebar)
-        elif keyval == Gdk.KEY_space:
-            self._toggle_play()
-            return True
-
-        # Toggle slideshow order (forward -> backward -> random -> forward)
-        elif keyval in (Gdk.KEY_o, Gdk.KEY_O):
-            self._cycle_order()
-            return True
-
-        # Toggle loop
-        elif keyval in (Gdk.KEY_l, Gdk.KEY_L):
-            self._config.loop = not self._config.loop
-            self._update_info_bar()
-            self._show_notification(f"Loop: {'ON' if self._config.loop else 'OFF'}")
-            return True
-
-        # Adjust slideshow time
-        elif keyval in (Gdk.KEY_equal, Gdk.KEY_KP_Equal):
-            self._adjust_slideshow_time(1.0)
-            return True
-        elif keyval in (Gdk.KEY_minus, Gdk.KEY_KP_Decimal):
-            self._adjust_slideshow_time(-1.0)
-            return True
-        elif keyval in (Gdk.KEY_bracketright, Gdk.KEY_KP_9):
-            self._adjust_slideshow_time(1.0)
-            return True
-        elif keyval in (Gdk.KEY_bracketleft, Gdk.KEY_KP_7):
-            self._adjust_slideshow_time(-1.0)
-            return True
-
-        # Rating
-        elif keyval in (Gdk.KEY_KP_Add, Gdk.KEY_plus):
-            self._change_rating(+1)
-            return True
-        elif keyval in (Gdk.KEY_KP_Subtract, Gdk.KEY_minus):
-            self._change_rating(-1)
-            return True
-
-        # Fullscreen toggle
-        elif keyval in (Gdk.KEY_f, Gdk.KEY_F):
-            if self._window.is_fullscreen():
-                self._window.unfullscreen()
-            else:
-                self._window.fullscreen()
-            return True
-
-        # Jump to first/last image
-        elif keyval == Gdk.KEY_Home:
-            self._reset_advance_timer()
-            self._current_index = 0
-            self._show_current()
-            return True
-        elif keyval == Gdk.KEY_End:
-            self._reset_advance_timer()
-            self._current_index = len(self._images) - 1
-            self._show_current()
-            return True
-
-        # Return to thumbnails
-        elif keyval in (Gdk.KEY_Escape, Gdk.KEY_q, Gdk.KEY_Q):
-            self._stop_advance()
-            if self._window.is_fullscreen():
-                self._window.unfullscreen()
-            # Hide slideshow immediately
-            self._window._stack.set_visible_child_name("loading")
-            # Defer thumbnail loading
-            GLib.idle_add(self._window.show_thumbnails)
-            return True
-
-        # Delete current image
-        elif keyval == Gdk.KEY_Delete:
-            self._delete_current_image()
-            return True
-
-        # Help overlay
-        elif keyval in (Gdk.KEY_question, Gdk.KEY_h, Gdk.KEY_H):
-            self._show_help()
-            return True
-
-        return False
+        # Fold case once so the table needs no uppercase duplicates
+        handler = self._KEY_TABLE.get(Gdk.keyval_to_lower(keyval))
+        if handler is None:
+            return False
+        handler(self)
+        return True
 
     def handle_key(self, keyval: int) -> bool:
         """Public method to handle a key press from window-level controller."""
@@ -796,12 +961,30 @@ class SlideshowView(Gtk.Overlay):
         if self._viewed_timer_id is not None:
             GLib.source_remove(self._viewed_timer_id)
             self._viewed_timer_id = None
+            self._viewed_timer_path = None
         
         # Cancel notification timer
         if self._notif_timer_id is not None:
             GLib.source_remove(self._notif_timer_id)
             self._notif_timer_id = None
-        
+
+        # Cancel pending resize
+        if self._resize_timer_id is not None:
+            GLib.source_remove(self._resize_timer_id)
+            self._resize_timer_id = None
+
+        # Flush a pending config save rather than dropping it
+        if self._save_timer_id is not None:
+            GLib.source_remove(self._save_timer_id)
+            self._save_timer_id = None
+            save_config(self._config)
+
+        # Drop in-flight decodes and cached pixbufs
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+        self._pixbuf_cache.clear()
+
         # Clear the image to free memory
         self._picture.set_pixbuf(None)
 
@@ -853,3 +1036,54 @@ Other:
         close_btn.connect("clicked", lambda _: dialog.destroy())
         
         dialog.present()
+
+
+def _nav(step: Callable[[SlideshowView], None]) -> Callable[[SlideshowView], None]:
+    """Wrap a navigation step so manual movement also resets the advance timer."""
+    def handler(view: SlideshowView) -> None:
+        view._reset_advance_timer()
+        step(view)
+    return handler
+
+
+SlideshowView._KEY_TABLE.update({
+    # Navigation - arrow keys and numpad
+    Gdk.KEY_Right: _nav(SlideshowView._go_next),
+    Gdk.KEY_KP_6: _nav(SlideshowView._go_next),
+    Gdk.KEY_Left: _nav(SlideshowView._go_prev),
+    Gdk.KEY_BackSpace: _nav(SlideshowView._go_prev),
+    Gdk.KEY_KP_4: _nav(SlideshowView._go_prev),
+    Gdk.KEY_Home: SlideshowView._go_first,
+    Gdk.KEY_End: SlideshowView._go_last,
+
+    # Play/pause and ordering
+    Gdk.KEY_space: SlideshowView._toggle_play,
+    Gdk.KEY_o: SlideshowView._cycle_order,
+    Gdk.KEY_l: SlideshowView._toggle_loop,
+
+    # Slideshow time. KEY_minus adjusts time, not rating — same first-match
+    # outcome as the old elif chain, which tested the time keys first.
+    Gdk.KEY_equal: lambda v: v._adjust_slideshow_time(1.0),
+    Gdk.KEY_KP_Equal: lambda v: v._adjust_slideshow_time(1.0),
+    Gdk.KEY_bracketright: lambda v: v._adjust_slideshow_time(1.0),
+    Gdk.KEY_KP_9: lambda v: v._adjust_slideshow_time(1.0),
+    Gdk.KEY_minus: lambda v: v._adjust_slideshow_time(-1.0),
+    Gdk.KEY_KP_Decimal: lambda v: v._adjust_slideshow_time(-1.0),
+    Gdk.KEY_bracketleft: lambda v: v._adjust_slideshow_time(-1.0),
+    Gdk.KEY_KP_7: lambda v: v._adjust_slideshow_time(-1.0),
+
+    # Rating
+    Gdk.KEY_KP_Add: lambda v: v._change_rating(+1),
+    Gdk.KEY_plus: lambda v: v._change_rating(+1),
+    Gdk.KEY_KP_Subtract: lambda v: v._change_rating(-1),
+
+    # Display
+    Gdk.KEY_f: SlideshowView._toggle_fullscreen,
+
+    # Other
+    Gdk.KEY_Escape: SlideshowView._back_to_thumbnails,
+    Gdk.KEY_q: SlideshowView._back_to_thumbnails,
+    Gdk.KEY_Delete: SlideshowView._delete_current_image,
+    Gdk.KEY_question: SlideshowView._show_help,
+    Gdk.KEY_h: SlideshowView._show_help,
+})
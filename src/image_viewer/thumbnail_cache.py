@@ -8,10 +8,16 @@ Thumbnails are cached at a fixed size (CACHE_THUMBNAIL_SIZE) and scaled in the v
 
 from __future__ import annotations
 
+import atexit
+import functools
 import hashlib
+import io
 import os
-from pathlib import Path
-from typing import Optional
+import queue
+import shutil
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Iterable, Iterator, Optional
 
 try:
     from PIL import Image as PilImage
@@ -19,27 +25,169 @@ try:
 except ImportError:
     HAS_PILLOW = False
 
+# Pillow-SIMD is a drop-in Pillow fork (versioned like "9.0.0.post1") whose
+# AVX2 resize convolutions are 4-6x faster; installing it instead of stock
+# pillow needs no code change here. Record what this interpreter got so the
+# resize/encode hot path is observable without profiling.
+if HAS_PILLOW:
+    HAS_SIMD_RESIZE = ".post" in getattr(PilImage, "__version__", "")
+    try:
+        from PIL import features as _pil_features
+        HAS_LIBJPEG_TURBO = bool(_pil_features.check_feature("libjpeg_turbo"))
+    except Exception:
+        HAS_LIBJPEG_TURBO = False
+else:
+    HAS_SIMD_RESIZE = False
+    HAS_LIBJPEG_TURBO = False
+
 # Fixed cache size - thumbnails are generated at this size and scaled in the view
 CACHE_THUMBNAIL_SIZE = 128
 
 # Cache folder name within each image directory
 CACHE_FOLDER = ".thumbnails"
 
+# Resample filter for cache generation. At 128px BICUBIC's 4-tap kernel is
+# visually indistinguishable from LANCZOS's 6-tap one and a third cheaper.
+CACHE_RESAMPLE = PilImage.BICUBIC if HAS_PILLOW else None
+
+
+# On-disk key cache: hashes survive across sessions, so after the first run
+# a library scan computes no digests at all. One tab-separated record per
+# line (mtime, cache_size, key, filepath — path last, it may be long).
+_KEY_CACHE_PATH = os.path.expanduser("~/.cache/image-viewer/keycache.txt")
+
+_key_cache: Optional[dict[tuple[str, float, int], str]] = None  # Lazy-loaded
+_key_cache_dirty = False
+
+
+def _load_key_cache() -> dict[tuple[str, float, int], str]:
+    cache: dict[tuple[str, float, int], str] = {}
+    try:
+        with open(_KEY_CACHE_PATH, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    mtime, cache_size, key, filepath = line.rstrip("\n").split("\t", 3)
+                    cache[(filepath, float(mtime), int(cache_size))] = key
+                except ValueError:
+                    continue  # Skip malformed records
+    except OSError:
+        pass
+    return cache
+
+
+def _save_key_cache() -> None:
+    if not _key_cache_dirty or _key_cache is None:
+        return
+    tmp_path = f"{_KEY_CACHE_PATH}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(_KEY_CACHE_PATH), exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for (filepath, mtime, cache_size), key in _key_cache.items():
+                f.write(f"{mtime}\t{cache_size}\t{key}\t{filepath}\n")
+        os.replace(tmp_path, _KEY_CACHE_PATH)
+    except OSError:
+        pass  # A lost key cache just means re-hashing next session
+
 
+# Memoized: the same key is computed for every existence check and again on
+# generation, and blake2b at digest_size=16 is both faster than sha256 and
+# collision-proof enough for a filename — while halving the name length
+@functools.lru_cache(maxsize=4096)
 def _cache_key(filepath: str, mtime: float, cache_size: int = CACHE_THUMBNAIL_SIZE) -> str:
     """Generate a unique cache filename for an image based on filename, mtime, and cache size."""
+    global _key_cache, _key_cache_dirty
+    if _key_cache is None:
+        _key_cache = _load_key_cache()
+        atexit.register(_save_key_cache)
+    cached = _key_cache.get((filepath, mtime, cache_size))
+    if cached is not None:
+        return cached
     # Include cache_size in the key so different cache sizes don't overwrite each other
     filename = os.path.basename(filepath)
     key = f"{filename}:{mtime}:{cache_size}"
-    return hashlib.sha256(key.encode()).hexdigest() + ".jpg"
+    digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest() + ".jpg"
+    _key_cache[(filepath, mtime, cache_size)] = digest
+    _key_cache_dirty = True
+    return digest
 
 
-def _get_cache_dir(filepath: str) -> Path:
-    """Get the cache directory for an image (creates if needed)."""
-    img_dir = Path(filepath).parent
-    cache_dir = img_dir / CACHE_FOLDER
-    cache_dir.mkdir(parents=True, exist_ok=True)
-    return cache_dir
+def _head_hash(filepath: str) -> Optional[str]:
+    """Cheap content fingerprint: blake2b of the first 64 KB."""
+    try:
+        with open(filepath, "rb") as f:
+            return hashlib.blake2b(f.read(65536), digest_size=16).hexdigest()
+    except OSError:
+        return None
+
+
+def _meta_path(filepath: str, cache_dir: str, cache_size: int) -> str:
+    """Sidecar path recording the last generation's content fingerprint.
+
+    Named by filename + cache_size only (no mtime), so it survives mtime
+    bumps and lets a later lookup find the previous thumbnail.
+    """
+    name = hashlib.blake2b(
+        f"{os.path.basename(filepath)}:{cache_size}".encode(), digest_size=16
+    ).hexdigest()
+    return os.path.join(cache_dir, name + ".meta")
+
+
+def _write_meta(
+    meta_path: str, mtime: float, size: int, head_hash: str, cache_filename: str
+) -> None:
+    try:
+        with open(meta_path, "w", encoding="utf-8") as f:
+            f.write(f"{mtime}\t{size}\t{head_hash}\t{cache_filename}\n")
+    except OSError:
+        pass  # Losing the sidecar only costs a regenerate on the next bump
+
+
+def _get_cache_dir(filepath: str) -> str:
+    """Return the cache directory path for an image.
+
+    Pure string work — the directory itself is created on demand by
+    _open_cache_file when a thumbnail is first written into it.
+    """
+    return os.path.join(os.path.dirname(filepath), CACHE_FOLDER)
+
+
+def _save_atomic(img: "PilImage.Image", cache_path: str, cache_dir: str) -> None:
+    """Encode img to cache_path via a unique temp file and atomic rename.
+
+    A crash mid-encode must not leave a truncated JPEG at the final path —
+    it would be served as a valid cache hit forever. The pid+thread-unique
+    temp name also keeps concurrent generations of the same thumbnail from
+    clobbering each other's in-progress writes; os.replace makes the last
+    completed one win atomically.
+    """
+    tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        fd = _open_cache_file(tmp_path, cache_dir)
+        with os.fdopen(fd, "wb") as out:
+            img.save(out, "JPEG", quality=80, progressive=False, subsampling=2)
+        os.replace(tmp_path, cache_path)
+    except Exception:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _open_cache_file(cache_path: str, cache_dir: str) -> int:
+    """Open cache_path for exclusive creation, making the directory on demand.
+
+    Probing the directory up front costs a stat per image even when it
+    exists; opening optimistically and treating the missing parent as the
+    error pays the mkdir only when genuinely needed. Raises FileExistsError
+    if a concurrent worker created the file first.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL
+    try:
+        return os.open(cache_path, flags, 0o644)
+    except FileNotFoundError:
+        os.makedirs(cache_dir, exist_ok=True)
+        return os.open(cache_path, flags, 0o644)
 
 
 def get_or_create_thumbnail(
@@ -67,32 +215,241 @@ def get_or_create_thumbnail(
 
     cache_dir = _get_cache_dir(filepath)
     cache_filename = _cache_key(filepath, mtime, cache_size)
-    cache_path = cache_dir / cache_filename
+    cache_path = os.path.join(cache_dir, cache_filename)
 
-    if cache_path.exists():
-        return str(cache_path)
+    # One stat, assuming the hit: on a warm gallery scan nearly every
+    # thumbnail already exists, so the exception path is the rare one
+    try:
+        os.stat(cache_path)
+        return cache_path
+    except FileNotFoundError:
+        pass
+
+    # mtime miss: before paying a full regenerate, check whether the bytes
+    # actually changed — git checkout and rsync -t bump mtimes on identical
+    # content. The sidecar holds the fingerprint from the last generation;
+    # on a match, adopt the old thumbnail under the new mtime-keyed name.
+    meta_path = _meta_path(filepath, cache_dir, cache_size)
+    try:
+        with open(meta_path, encoding="utf-8") as f:
+            _, old_size, old_hash, old_name = f.read().rstrip("\n").split("\t", 3)
+        src_size = os.stat(filepath).st_size
+        if int(old_size) == src_size and old_hash == _head_hash(filepath):
+            os.replace(os.path.join(cache_dir, old_name), cache_path)
+            _write_meta(meta_path, mtime, src_size, old_hash, cache_filename)
+            return cache_path
+    except (OSError, ValueError):
+        pass
 
     try:
         with PilImage.open(filepath) as img:
-            # Convert to RGB for JPEG saving (handles RGBA, P mode, etc.)
-            if img.mode not in ("RGB", "L"):
-                img = img.convert("RGB")
-            # Always use configured cache size
-            img.thumbnail((cache_size, cache_size), PilImage.LANCZOS)
-            img.save(str(cache_path), "JPEG", quality=85, optimize=True)
-        return str(cache_path)
+            # A JPEG already at or below the cache size can serve as its own
+            # thumbnail: hardlink (or copy, across filesystems) the original
+            # and skip decode and re-encode entirely. open() has only read
+            # the header at this point, so img.size costs no pixel work.
+            # Non-JPEG sources still convert, keeping the cache all-JPEG.
+            if img.format == "JPEG" and max(img.size) <= cache_size:
+                os.makedirs(cache_dir, exist_ok=True)
+                try:
+                    os.link(filepath, cache_path)
+                except FileExistsError:
+                    pass
+                except OSError:
+                    shutil.copyfile(filepath, cache_path)
+            else:
+                # Ask libjpeg to decode at reduced scale (1/2, 1/4, 1/8)
+                # straight from the DCT coefficients; thumbnail() below
+                # refines to exact size. 2x the target keeps enough detail
+                # for the final resample. draft() is a no-op for non-JPEGs.
+                try:
+                    img.draft("RGB", (cache_size * 2, cache_size * 2))
+                except Exception:
+                    pass
+                # Convert to RGB for JPEG saving (handles RGBA, P mode, etc.)
+                if img.mode not in ("RGB", "L"):
+                    img = img.convert("RGB")
+                # Always use configured cache size
+                img.thumbnail((cache_size, cache_size), CACHE_RESAMPLE)
+                # No optimize=True: the extra Huffman pass roughly doubles
+                # encode time to shave a few bytes off a ~5 KB file.
+                # quality=80 and explicit 4:2:0 subsampling are invisible
+                # at 128px.
+                _save_atomic(img, cache_path, cache_dir)
+        head = _head_hash(filepath)
+        if head is not None:
+            try:
+                _write_meta(
+                    meta_path, mtime, os.stat(filepath).st_size, head, cache_filename
+                )
+            except OSError:
+                pass
+        return cache_path
     except Exception as e:
         # Silently fail — the viewer will fall back to loading the full image
         return None
 
 
+def scan_existing_thumbnails(img_dir: str) -> set[str]:
+    """Return the cache filenames already present for a directory of images.
+
+    One scandir of img_dir/.thumbnails replaces a stat per image: callers
+    pass the set to get_or_create_thumbnail_batched and hit a membership
+    test instead of the filesystem.
+    """
+    existing: set[str] = set()
+    try:
+        with os.scandir(os.path.join(img_dir, CACHE_FOLDER)) as entries:
+            for entry in entries:
+                existing.add(entry.name)
+    except OSError:
+        pass  # No cache dir yet — every thumbnail is a miss
+    return existing
+
+
+def get_or_create_thumbnail_batched(
+    filepath: str,
+    mtime: float,
+    existing: set[str],
+    cache_size: int = CACHE_THUMBNAIL_SIZE,
+) -> Optional[str]:
+    """get_or_create_thumbnail with the existence check served from a set.
+
+    existing is the result of scan_existing_thumbnails for the image's
+    directory; hits cost a hash lookup, no syscall.
+    """
+    cache_filename = _cache_key(filepath, mtime, cache_size)
+    if cache_filename in existing:
+        return os.path.join(os.path.dirname(filepath), CACHE_FOLDER, cache_filename)
+    return get_or_create_thumbnail(filepath, mtime, cache_size=cache_size)
+
+
+# Generation workers: one per core — Pillow releases the GIL around
+# libjpeg/zlib, so decode+resize+encode parallelizes across threads
+_THUMB_POOL = ThreadPoolExecutor(max_workers=os.cpu_count() or 4)
+
+
+def get_or_create_thumbnail_async(
+    filepath: str,
+    mtime: float,
+    size: int = 200,
+    cache_size: int = CACHE_THUMBNAIL_SIZE,
+) -> "Future[Optional[str]]":
+    """Submit get_or_create_thumbnail to the worker pool and return its Future.
+
+    Each call blocks a worker for a full decode + resize + encode, so GTK
+    callers should use this and install the result via GLib.idle_add rather
+    than generating thumbnails on the main loop.
+    """
+    return _THUMB_POOL.submit(
+        get_or_create_thumbnail, filepath, mtime, size, cache_size
+    )
+
+
+def prefetch_thumbnails(
+    items: Iterable[tuple[str, float]],
+    cache_size: int = CACHE_THUMBNAIL_SIZE,
+) -> "list[Future[Optional[str]]]":
+    """Queue thumbnail generation for (filepath, mtime) pairs in bulk."""
+    return [
+        _THUMB_POOL.submit(get_or_create_thumbnail, filepath, mtime, cache_size=cache_size)
+        for filepath, mtime in items
+    ]
+
+
+# End-of-stream marker for pipeline_thumbnails' read-ahead queue
+_PIPELINE_DONE = object()
+
+# Read-ahead depth: enough to hide one file's disk latency behind the
+# previous decode without holding many raw JPEGs in memory
+_PIPELINE_DEPTH = 4
+
+
+def pipeline_thumbnails(
+    items: Iterable[tuple[str, float]],
+    cache_size: int = CACHE_THUMBNAIL_SIZE,
+) -> Iterator[Optional[str]]:
+    """Generate thumbnails for (filepath, mtime) pairs, overlapping I/O and decode.
+
+    A reader thread streams raw file bytes into a bounded queue while the
+    consuming thread decodes and encodes — on slow storage the disk read of
+    image N+1 hides behind the CPU work on image N. Yields one cache path
+    (or None on failure) per item, in order. Cache hits skip the read.
+    """
+    items = list(items)
+    if not HAS_PILLOW:
+        for _ in items:
+            yield None
+        return
+
+    raw_q: queue.Queue = queue.Queue(maxsize=_PIPELINE_DEPTH)
+    cancelled = threading.Event()
+
+    def reader() -> None:
+        for filepath, mtime in items:
+            cache_dir = _get_cache_dir(filepath)
+            cache_filename = _cache_key(filepath, mtime, cache_size)
+            cache_path = os.path.join(cache_dir, cache_filename)
+            try:
+                os.stat(cache_path)
+                record = (cache_path, None, None)  # Hit: nothing to decode
+            except FileNotFoundError:
+                try:
+                    with open(filepath, "rb") as f:
+                        record = (cache_path, (filepath, mtime, cache_filename, cache_dir), f.read())
+                except OSError:
+                    record = (None, None, None)
+            while not cancelled.is_set():
+                try:
+                    raw_q.put(record, timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+            if cancelled.is_set():
+                return
+        raw_q.put(_PIPELINE_DONE)
+
+    thread = threading.Thread(target=reader, name="thumb-pipeline-io", daemon=True)
+    thread.start()
+    try:
+        while True:
+            record = raw_q.get()
+            if record is _PIPELINE_DONE:
+                break
+            cache_path, src, data = record
+            if data is None:
+                yield cache_path  # Cache hit, or None for an unreadable file
+                continue
+            filepath, mtime, cache_filename, cache_dir = src
+            try:
+                with PilImage.open(io.BytesIO(data)) as img:
+                    try:
+                        img.draft("RGB", (cache_size * 2, cache_size * 2))
+                    except Exception:
+                        pass
+                    if img.mode not in ("RGB", "L"):
+                        img = img.convert("RGB")
+                    img.thumbnail((cache_size, cache_size), CACHE_RESAMPLE)
+                    _save_atomic(img, cache_path, cache_dir)
+                head = hashlib.blake2b(data[:65536], digest_size=16).hexdigest()
+                _write_meta(
+                    _meta_path(filepath, cache_dir, cache_size),
+                    mtime, len(data), head, cache_filename,
+                )
+                yield cache_path
+            except Exception:
+                yield None
+    finally:
+        cancelled.set()  # Unblock the reader if the consumer stopped early
+
+
 def invalidate_cache(filepath: str, mtime: float, cache_size: int = CACHE_THUMBNAIL_SIZE) -> None:
     """Remove a cached thumbnail if it exists."""
     cache_dir = _get_cache_dir(filepath)
     cache_filename = _cache_key(filepath, mtime, cache_size)
-    cache_path = cache_dir / cache_filename
-    if cache_path.exists():
-        cache_path.unlink()
+    try:
+        os.unlink(os.path.join(cache_dir, cache_filename))
+    except FileNotFoundError:
+        pass
 
 
 def clear_all_cache(base_dirs: Optional[list[str]] = None) -> int:
@@ -106,24 +463,57 @@ def clear_all_cache(base_dirs: Optional[list[str]] = None) -> int:
         Number of cache files deleted.
     """
     count = 0
+    for count, _ in iter_clear_all_cache(base_dirs):
+        pass
+    return count
+
+
+def iter_clear_all_cache(
+    base_dirs: Optional[list[str]] = None,
+) -> Iterator[tuple[int, str]]:
+    """Delete cached thumbnails one at a time, yielding (count, path) per file.
+
+    The streaming form lets a background thread report progress after each
+    deletion and stop early by abandoning the iterator — clearing a large
+    cold cache can take seconds, too long to block on silently.
+    """
+    count = 0
     search_dirs = base_dirs if base_dirs else ["."]
-    
+
     for base_dir in search_dirs:
-        base_path = Path(base_dir)
-        if not base_path.exists():
-            continue
-        
         # Find all .thumbnails folders under this base directory
-        for thumb_dir in base_path.rglob(CACHE_FOLDER):
-            if thumb_dir.is_dir():
-                try:
-                    for cache_file in thumb_dir.iterdir():
-                        if cache_file.is_file():
-                            cache_file.unlink()
+        for thumb_dir in _find_cache_dirs(base_dir):
+            try:
+                with os.scandir(thumb_dir) as entries:
+                    for entry in entries:
+                        if entry.is_file(follow_symlinks=False):
+                            os.unlink(entry.path)
                             count += 1
-                    # Remove the empty directory
-                    thumb_dir.rmdir()
-                except Exception:
-                    pass  # Ignore errors during cleanup
-    
-    return count
+                            yield (count, entry.path)
+                # Remove the empty directory
+                os.rmdir(thumb_dir)
+            except OSError:
+                pass  # Ignore errors during cleanup
+
+
+def _find_cache_dirs(path: str) -> Iterator[str]:
+    """Yield every CACHE_FOLDER directory under path, recursively.
+
+    Uses os.scandir so type checks come from the directory read itself
+    instead of the extra stat per entry that pathlib.rglob pays.
+    """
+    try:
+        entries = os.scandir(path)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            try:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+            except OSError:
+                continue
+            if entry.name == CACHE_FOLDER:
+                yield entry.path
+            else:
+                yield from _find_cache_dirs(entry.path)
@@ -11,29 +11,80 @@ Displays a scrollable, reflowing grid of image thumbnails with:
 from __future__ import annotations
 
 import os
+import queue
 import threading
 import time
-from typing import Optional, TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, ClassVar, Optional, TYPE_CHECKING
 
 import gi
 gi.require_version("Gtk", "4.0")
 from gi.repository import Gtk, GLib, Gdk, GdkPixbuf, Pango
 
 from .models import AppConfig, ImageInfo
-from .sorting import SORT_OPTIONS, sort_images
+from .sorting import SORT_NAMES, SORT_OPTIONS, sort_images
 from .thumbnail_cache import get_or_create_thumbnail
 
 if TYPE_CHECKING:
     from .app import MainWindow, ImageViewerApp
 
+# Optional: libjpeg-turbo decodes JPEGs 2-7x faster than the stock GdkPixbuf
+# loader and can emit 1/2, 1/4, 1/8 size directly from the DCT coefficients,
+# which matches thumbnail targets. TurboJPEG() raises OSError when the shared
+# library itself is missing, so probe wider than ImportError.
+try:
+    from turbojpeg import TJPF_RGB, TurboJPEG
+    _TURBO = TurboJPEG()
+    HAS_TURBOJPEG = True
+except Exception:
+    _TURBO = None
+    HAS_TURBOJPEG = False
+
 
 # Stars display
 STAR_FILLED = "★"
 STAR_EMPTY = "☆"
 
+# All six rating strings, built once: _rating_stars runs per tile on every
+# rebuild, so indexing beats re-concatenating
+_RATING_CACHE = tuple(STAR_FILLED * r + STAR_EMPTY * (5 - r) for r in range(6))
+
 
 def _rating_stars(rating: int) -> str:
-    return STAR_FILLED * rating + STAR_EMPTY * (5 - rating)
+    return _RATING_CACHE[rating]
+
+
+def _build_rating_attrs() -> Pango.AttrList:
+    """Pango attributes matching the old .rating-stars CSS (11px, #f0a500).
+
+    Setting attributes directly skips the CSS class lookup that style
+    resolution would otherwise repeat for every rating label in the grid.
+    One shared AttrList serves all labels; Pango channels are 16-bit.
+    """
+    attrs = Pango.AttrList()
+    attrs.insert(Pango.attr_size_new(11 * Pango.SCALE))
+    attrs.insert(Pango.attr_foreground_new(0xF0F0, 0xA5A5, 0x0000))
+    return attrs
+
+
+_RATING_ATTRS = _build_rating_attrs()
+
+
+# Wakes the decode workers for shutdown: sorts ahead of every real entry
+_QUEUE_STOP = (-1, -1, None)
+
+# Shared decode pool, kept alive across grid rebuilds. GdkPixbuf and Pillow
+# both release the GIL around native decode, so cold-cache population scales
+# with core count instead of serializing on one background thread.
+_POOL_WORKERS = os.cpu_count() or 4
+_DECODE_POOL = ThreadPoolExecutor(max_workers=_POOL_WORKERS)
+
+# The view CSS is static; install its provider on the display only once
+_css_provider_installed = False
+
+# Dropdown position per sort name — O(1) lookups instead of rebuilding
+# [s[0] for s in SORT_OPTIONS] and scanning it on every sort event
+_SORT_INDEX = {name: i for i, name in enumerate(SORT_NAMES)}
 
 
 class ThumbnailTile(Gtk.Box):
@@ -52,6 +103,7 @@ class ThumbnailTile(Gtk.Box):
         self._highlight_color = highlight_color
         self._unviewed_indicator = unviewed_indicator
         self._selected = False
+        self._state = ""  # Currently applied state CSS class ("" = none)
 
         self.set_margin_top(4)
         self.set_margin_bottom(4)
@@ -68,43 +120,58 @@ class ThumbnailTile(Gtk.Box):
         self._picture.set_content_fit(Gtk.ContentFit.CONTAIN)
         self._overlay.set_child(self._picture)
 
-        # Unviewed dot indicator (top-right corner)
-        if unviewed_indicator == "dot" and not image_info.viewed:
+        # Unviewed dot indicator (top-right corner). Always built when the
+        # indicator style is "dot" so a pooled tile can toggle it on rebind
+        self._dot: Optional[Gtk.Label] = None
+        if unviewed_indicator == "dot":
             dot = Gtk.Label(label="●")
             dot.add_css_class("unviewed-dot")
             dot.set_halign(Gtk.Align.END)
             dot.set_valign(Gtk.Align.START)
             dot.set_margin_end(4)
             dot.set_margin_top(4)
+            dot.set_visible(not image_info.viewed)
             self._overlay.add_overlay(dot)
+            self._dot = dot
 
         # Filename label
-        name_label = Gtk.Label(label=image_info.display_name)
-        name_label.set_ellipsize(Pango.EllipsizeMode.END)
-        name_label.set_max_width_chars(20)
-        name_label.set_tooltip_text(image_info.filename)
-        self.append(name_label)
+        self._name_label = Gtk.Label(label=image_info.display_name)
+        self._name_label.set_ellipsize(Pango.EllipsizeMode.END)
+        self._name_label.set_max_width_chars(20)
+        self._name_label.set_tooltip_text(image_info.filename)
+        self.append(self._name_label)
 
         # Rating label
         self._rating_label = Gtk.Label(label=_rating_stars(image_info.rating))
-        self._rating_label.add_css_class("rating-stars")
+        self._rating_label.set_attributes(_RATING_ATTRS)
         self.append(self._rating_label)
 
         # Apply CSS classes
         self._update_css()
 
     def _update_css(self) -> None:
-        """Apply CSS classes based on state."""
-        # Remove existing state classes
-        for cls in ("selected", "unviewed-border", "viewed"):
-            self.remove_css_class(cls)
+        """Apply the state CSS class, mutating only on an actual change.
 
+        Unconditionally removing three classes and re-adding one invalidated
+        styles on every _select, even when nothing changed; diffing against
+        the applied state makes a no-op free and a change exactly two
+        mutations, which matters during held-key navigation.
+        """
         if self._selected:
-            self.add_css_class("selected")
+            new_state = "selected"
         elif self._unviewed_indicator == "border" and not self.image_info.viewed:
-            self.add_css_class("unviewed-border")
+            new_state = "unviewed-border"
         elif self.image_info.viewed:
-            self.add_css_class("viewed")
+            new_state = "viewed"
+        else:
+            new_state = ""
+        if new_state == self._state:
+            return
+        if self._state:
+            self.remove_css_class(self._state)
+        if new_state:
+            self.add_css_class(new_state)
+        self._state = new_state
 
     def set_selected(self, selected: bool) -> None:
         self._selected = selected
@@ -115,8 +182,10 @@ class ThumbnailTile(Gtk.Box):
         self.thumb_size = size
         self._picture.set_size_request(size, size)
 
-    def set_pixbuf(self, pixbuf: GdkPixbuf.Pixbuf) -> None:
-        self._picture.set_pixbuf(pixbuf)
+    def set_texture(self, texture: Gdk.Texture) -> None:
+        # set_paintable is a ref bump; set_pixbuf would wrap the pixbuf in a
+        # texture here, on the main thread, per call
+        self._picture.set_paintable(texture)
 
     def update_rating(self, rating: int) -> None:
         self.image_info.rating = rating
@@ -124,6 +193,24 @@ class ThumbnailTile(Gtk.Box):
 
     def update_viewed(self, viewed: bool) -> None:
         self.image_info.viewed = viewed
+        if self._dot is not None:
+            self._dot.set_visible(not viewed)
+        self._update_css()
+
+    def rebind(self, image_info: ImageInfo) -> None:
+        """Point a pooled tile at a different image.
+
+        Widget construction (box, overlay, picture, labels, controllers) is
+        the expensive part of a tile; swapping the bound data is cheap.
+        """
+        self.image_info = image_info
+        self._picture.set_paintable(None)
+        self._name_label.set_label(image_info.display_name)
+        self._name_label.set_tooltip_text(image_info.filename)
+        self._rating_label.set_label(_rating_stars(image_info.rating))
+        if self._dot is not None:
+            self._dot.set_visible(not image_info.viewed)
+        self._selected = False
         self._update_css()
 
 
@@ -143,13 +230,39 @@ class ThumbnailView(Gtk.Box):
 
         self._images: list[ImageInfo] = []
         self._tiles: list[ThumbnailTile] = []
+        self._index_by_path: dict[str, int] = {}  # filepath -> grid index
+        self._tile_pool: list[ThumbnailTile] = []  # Detached tiles for reuse
+        # Viewed total, recounted once per load and adjusted on mutation so
+        # _update_status stays O(1) during held-key navigation
+        self._viewed_count: int = 0
+        # Decoded thumbnails by filepath; lets re-sorts and rebuilds reuse
+        # textures already in memory instead of re-issuing every decode
+        self._texture_cache: dict[str, Gdk.Texture] = {}
         self._selected_index: int = 0
         self._columns: int = 1
         self._loading_cancelled: bool = False  # Flag to stop background thumbnail loading
-        self._size_timer_id: int | None = None  # Timer for periodic column check during resize
-        self._size_idle_id: int | None = None  # Idle callback for stopping the timer
-        self._fixed_width: int | None = None  # Fixed width for column calculation during resize
-        self._last_column_update: float = 0  # Timestamp of last column update for throttling
+        # Viewport-driven decode queue: visible tiles decode first, the rest
+        # by distance from the viewport, so opening a huge directory costs
+        # what's on screen rather than the whole list
+        self._thumb_queue: Optional[queue.PriorityQueue] = None
+        self._loaded_indices: set[int] = set()
+        self._queue_seq: int = 0  # FIFO tie-break within a priority band
+        self._last_visible_range: tuple[int, int] = (0, 0)
+        # Bumped whenever grid indices change; workers carry the value they
+        # were started with so applies scheduled against an old layout are
+        # dropped instead of landing on the wrong (or a vanished) tile
+        self._generation: int = 0
+        # Cheap content fingerprint of the last loaded list; catches callers
+        # that pass a new list object holding the same images in the same
+        # order, which the identity check alone misses
+        self._last_fingerprint: tuple[int, tuple[int, ...]] = (-1, ())
+        # Decoded pixbufs waiting to be applied, flushed in batches so the
+        # main loop wakes once per batch instead of once per tile
+        self._pending_textures: list[tuple[int, Gdk.Texture]] = []
+        self._pending_lock = threading.Lock()
+        self._pending_size: int | None = None  # Slider value awaiting commit
+        self._resize_timeout: int | None = None  # Debounce source for size commits
+        self._max_per_line: int = 100  # Until the first width allocation arrives
 
         # Toolbar
         toolbar = self._build_toolbar()
@@ -160,18 +273,15 @@ class ThumbnailView(Gtk.Box):
         self._scrolled.set_vexpand(True)
         self._scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
         self.append(self._scrolled)
+        # Re-prioritize pending thumbnail decodes as the viewport moves
+        self._scrolled.get_vadjustment().connect("value-changed", self._on_scroll)
+        # The hadjustment's "changed" fires on width allocation: keep the
+        # FlowBox line cap matched to what actually fits instead of a flat
+        # 100, which made it lay out futile wide rows before clipping
+        self._scrolled.get_hadjustment().connect("changed", self._on_width_changed)
 
         # FlowBox for reflowing grid
-        # Use NONE selection mode to prevent FlowBox from intercepting arrow keys
-        # and creating its own blue highlight. We manage selection ourselves.
-        self._flow = Gtk.FlowBox()
-        self._flow.set_valign(Gtk.Align.START)
-        self._flow.set_max_children_per_line(100)
-        self._flow.set_min_children_per_line(1)
-        self._flow.set_selection_mode(Gtk.SelectionMode.NONE)
-        self._flow.set_homogeneous(True)
-        self._flow.set_row_spacing(4)
-        self._flow.set_column_spacing(4)
+        self._flow = self._new_flow()
         self._scrolled.set_child(self._flow)
 
         # Status bar
@@ -189,6 +299,22 @@ class ThumbnailView(Gtk.Box):
         # Apply CSS
         self._apply_css()
 
+    def _new_flow(self) -> Gtk.FlowBox:
+        """Build an empty grid FlowBox with the standard settings.
+
+        NONE selection mode prevents FlowBox from intercepting arrow keys
+        and drawing its own blue highlight; we manage selection ourselves.
+        """
+        flow = Gtk.FlowBox()
+        flow.set_valign(Gtk.Align.START)
+        flow.set_max_children_per_line(self._max_per_line)
+        flow.set_min_children_per_line(1)
+        flow.set_selection_mode(Gtk.SelectionMode.NONE)
+        flow.set_homogeneous(True)
+        flow.set_row_spacing(4)
+        flow.set_column_spacing(4)
+        return flow
+
     def _build_toolbar(self) -> Gtk.Box:
         """Build the top toolbar with sort selector and info."""
         toolbar = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
@@ -216,12 +342,9 @@ class ThumbnailView(Gtk.Box):
         self._sort_combo.set_model(sort_strings)
 
         # Set current sort
-        sort_names = [s[0] for s in SORT_OPTIONS]
-        try:
-            idx = sort_names.index(self._config.sort)
+        idx = _SORT_INDEX.get(self._config.sort)
+        if idx is not None:
             self._sort_combo.set_selected(idx)
-        except ValueError:
-            pass
 
         self._sort_combo.connect("notify::selected", self._on_sort_changed)
         toolbar.append(self._sort_combo)
@@ -286,12 +409,7 @@ class ThumbnailView(Gtk.Box):
         else:
             # Temporarily switch to random sort
             self._config.sort = "random"
-            sort_names = [s[0] for s in SORT_OPTIONS]
-            try:
-                idx = sort_names.index("random")
-                self._sort_combo.set_selected(idx)
-            except ValueError:
-                pass
+            self._sort_combo.set_selected(_SORT_INDEX["random"])
             self._resort_images()
 
     def _on_recursive_toggled(self, btn: Gtk.ToggleButton) -> None:
@@ -301,10 +419,25 @@ class ThumbnailView(Gtk.Box):
         self._window._save_config()
 
     def _on_size_changed(self, scale: Gtk.Scale) -> None:
-        """Handle thumbnail size change - update display size in real-time."""
-        new_size = int(scale.get_value())
+        """Handle thumbnail size change, debounced.
+
+        Dragging the slider fires value-changed per pixel; resizing N tiles
+        and writing the config on each event made drag cost O(events x N)
+        plus a disk-write storm. Only the last value within 150 ms commits.
+        """
+        self._pending_size = int(scale.get_value())
+        if self._resize_timeout is not None:
+            GLib.source_remove(self._resize_timeout)
+        self._resize_timeout = GLib.timeout_add(150, self._commit_size)
+
+    def _commit_size(self) -> bool:
+        """Apply the debounced thumbnail size to every tile and persist it."""
+        self._resize_timeout = None
+        new_size = self._pending_size
+        if new_size is None or new_size == self._config.thumbnail_size:
+            return GLib.SOURCE_REMOVE
         self._config.thumbnail_size = new_size
-        
+
         # Update the picture size request for each tile and its container
         for i, tile in enumerate(self._tiles):
             tile.set_size_request(new_size)
@@ -314,53 +447,14 @@ class ThumbnailView(Gtk.Box):
                 fb_child.set_size_request(new_size, new_size)
         # Queue resize to trigger GTK's natural reflow
         self._flow.queue_resize()
-        # Save config (debounced by the slider)
-        self._window._save_config()
-
-        # Start periodic column check if not already running
-        if self._size_timer_id is None:
-            self._size_timer_id = GLib.timeout_add(100, self._update_columns_periodic)
-
-        # Cancel any pending stop and schedule a new one
-        if self._size_idle_id is not None:
-            GLib.source_remove(self._size_idle_id)
-        # Use a longer delay to avoid resetting too frequently
-        self._size_idle_id = GLib.idle_add(self._stop_size_timer_delayed)
-
-    def _stop_size_timer_delayed(self) -> bool:
-        """Stop the periodic column check after a delay (called via idle)."""
-        self._size_idle_id = None
-        # Wait a bit then stop the timer and reset fixed width
-        def stop_and_reset():
-            self._stop_size_timer()
-            self._fixed_width = None
-            print("[DEBUG] Reset fixed width")
-            return False
-        GLib.timeout_add(200, stop_and_reset)
-        return False
-
-    def _update_columns_periodic(self) -> bool:
-        """Periodically check and update column count during slider drag (throttled)."""
-        # Throttle: only update every 300ms
-        current_time = time.time()
-        if current_time - self._last_column_update < 0.3:
-            return True  # Keep timer running
-        
-        self._last_column_update = current_time
         self._update_column_count()
-        # Keep timer running - it will be stopped by _stop_size_timer
-        return True
-
-    def _stop_size_timer(self) -> None:
-        """Stop the periodic column check timer."""
-        if self._size_timer_id is not None:
-            GLib.source_remove(self._size_timer_id)
-            self._size_timer_id = None
+        self._window._save_config()
+        return GLib.SOURCE_REMOVE
 
     def _update_column_count(self) -> None:
         """Calculate column count based on current window width.
-        
-        This is called periodically during slider drag to update the column count
+
+        Called after a committed size change to update the column count
         for keyboard navigation. GTK handles the natural reflow.
         """
         # Get the current width of the scrolled window
@@ -384,7 +478,14 @@ class ThumbnailView(Gtk.Box):
         if columns != self._columns:
             print(f"[DEBUG] Columns: {self._columns} -> {columns} (width={scroll_width}, tile={tile_width})")
             self._columns = columns
-            # Let GTK handle natural reflow - no forced min/max
+            # Cap the line length at what fits so FlowBox stops laying out
+            # rows it will immediately clip
+            self._max_per_line = columns
+            self._flow.set_max_children_per_line(columns)
+
+    def _on_width_changed(self, hadj: Gtk.Adjustment) -> None:
+        """Re-derive the column cap when the viewport width changes."""
+        self._update_column_count()
 
     def _resort_images(self) -> None:
         """Re-sort images with the current sort mode and reload."""
@@ -392,7 +493,16 @@ class ThumbnailView(Gtk.Box):
         self.load_images(sorted_images)
 
     def _apply_css(self) -> None:
-        """Apply CSS styling."""
+        """Install the view CSS on the default display, once per process.
+
+        The rules are static, so re-parsing and re-registering a provider on
+        every view construction only grew the display's provider stack and
+        slowed style resolution for all widgets.
+        """
+        global _css_provider_installed
+        if _css_provider_installed:
+            return
+        _css_provider_installed = True
         css = """
         .selected {
             background-color: alpha(@accent_color, 0.3);
@@ -410,10 +520,6 @@ class ThumbnailView(Gtk.Box):
             color: #4a90d9;
             font-size: 14px;
         }
-        .rating-stars {
-            font-size: 11px;
-            color: #f0a500;
-        }
         .loading-label {
             font-size: 18px;
             margin: 8px 40px;
@@ -438,11 +544,40 @@ class ThumbnailView(Gtk.Box):
         If the images list is the same object as the current images,
         the grid is not rebuilt (thumbnails are already loaded).
         """
+        # Viewed flags are mutated by the slideshow while this view is
+        # hidden, so recount on every load — including the skip paths —
+        # then let _update_status read the cached total
+        self._viewed_count = sum(1 for img in images if img.viewed)
+
         # Skip rebuilding if images are the same object (no changes)
         if images is self._images and self._tiles:
             print(f"[DEBUG] load_images: same images object, skipping rebuild ({len(images)} images)")
+            self._update_status()
             return
-        
+
+        # Same content in the same order but a different list object
+        fingerprint = (
+            len(images),
+            tuple(id(x) for x in images[:3] + images[-3:]),
+        )
+        if self._tiles and fingerprint == self._last_fingerprint:
+            print(f"[DEBUG] load_images: unchanged fingerprint, skipping rebuild ({len(images)} images)")
+            self._images = images
+            self._update_status()
+            return
+        self._last_fingerprint = fingerprint
+
+        # Same image set in a different order (sort change): reorder the
+        # existing tiles rather than rebuilding and re-decoding all of them
+        if (
+            self._tiles
+            and len(images) == len(self._images)
+            and all(img.filepath in self._index_by_path for img in images)
+        ):
+            print(f"[DEBUG] load_images: same image set, reordering {len(images)} tiles")
+            self._reorder_grid(images)
+            return
+
         print(f"[DEBUG] load_images: rebuilding grid with {len(images)} images")
         self._images = images
         self._selected_index = 0
@@ -453,136 +588,317 @@ class ThumbnailView(Gtk.Box):
     def _rebuild_grid(self) -> None:
         """Clear and rebuild the flow box with new tiles."""
         print(f"[DEBUG] _rebuild_grid called, creating {len(self._images)} tiles")
-        # Remove all existing children
-        child = self._flow.get_first_child()
-        while child:
-            next_child = child.get_next_sibling()
-            self._flow.remove(child)
-            child = next_child
+        self._generation += 1
+        # Detach the old tiles into the pool before dropping the container;
+        # rebinding a pooled tile skips the widget+label+overlay construction
+        # that dominates rebuild cost
+        if self._tiles:
+            child = self._flow.get_first_child()
+            while child:
+                child.set_child(None)
+                child = child.get_next_sibling()
+            self._tile_pool.extend(self._tiles)
+        # Removing children one by one re-layouts the FlowBox per removal,
+        # making clears O(N^2); dropping the whole container is one unparent
+        self._flow = self._new_flow()
+        self._scrolled.set_child(self._flow)
 
         self._tiles = []
 
         for i, img in enumerate(self._images):
-            tile = ThumbnailTile(
-                img,
-                self._config.thumbnail_size,
-                self._config.highlight_color,
-                self._config.unviewed_indicator,
-            )
+            if self._tile_pool:
+                tile = self._tile_pool.pop()
+                tile.rebind(img)
+                tile.set_size_request(self._config.thumbnail_size)
+            else:
+                tile = ThumbnailTile(
+                    img,
+                    self._config.thumbnail_size,
+                    self._config.highlight_color,
+                    self._config.unviewed_indicator,
+                )
             tile.set_selected(i == self._selected_index)
+            cached = self._texture_cache.get(img.filepath)
+            if cached is not None:
+                tile.set_texture(cached)
 
-            # Wrap in a FlowBoxChild
-            fb_child = Gtk.FlowBoxChild()
-            fb_child.set_child(tile)
-            # Make FlowBoxChild non-focusable to prevent FlowBox from
-            # intercepting arrow keys for focus navigation
-            fb_child.set_can_focus(False)
+            self._flow.append(self._wrap_tile(tile))
+            self._tiles.append(tile)
 
-            # Double-click gesture
-            click = Gtk.GestureClick()
-            click.connect("released", self._on_tile_clicked, i)
-            fb_child.add_controller(click)
+        self._index_by_path = {
+            img.filepath: i for i, img in enumerate(self._images)
+        }
+        # Drop cached textures for images no longer in the grid
+        if len(self._texture_cache) > len(self._index_by_path):
+            self._texture_cache = {
+                path: tex
+                for path, tex in self._texture_cache.items()
+                if path in self._index_by_path
+            }
+
+        # Load thumbnails in background
+        self._load_thumbnails_async()
+
+    def _wrap_tile(self, tile: ThumbnailTile) -> Gtk.FlowBoxChild:
+        """Wrap a tile in a non-focusable, click-handling FlowBoxChild.
+
+        Non-focusable so FlowBox does not intercept arrow keys for focus
+        navigation. The gesture carries the tile, not an index: indices
+        shift when a tile is deleted in place, the tile never does.
+        """
+        fb_child = Gtk.FlowBoxChild()
+        fb_child.set_child(tile)
+        fb_child.set_can_focus(False)
+
+        click = Gtk.GestureClick()
+        click.connect("released", self._on_tile_clicked, tile)
+        fb_child.add_controller(click)
 
-            # Note: No hover selection - must click to select
+        # Note: No hover selection - must click to select
+        return fb_child
 
-            self._flow.append(fb_child)
+    def _reorder_grid(self, new_images: list[ImageInfo]) -> None:
+        """Rearrange existing tiles to match a new ordering of the same set.
+
+        The pixbufs are already decoded and sitting in the tiles; only the
+        ordering changed, so detach each tile from its FlowBoxChild and
+        re-append in the new order instead of rebuilding and re-decoding.
+        """
+        self._generation += 1
+        tiles_by_path = {t.image_info.filepath: t for t in self._tiles}
+        child = self._flow.get_first_child()
+        while child:
+            child.set_child(None)
+            child = child.get_next_sibling()
+
+        self._flow = self._new_flow()
+        self._scrolled.set_child(self._flow)
+
+        self._images = new_images
+        self._tiles = []
+        for img in new_images:
+            tile = tiles_by_path[img.filepath]
+            tile.set_selected(False)
+            self._flow.append(self._wrap_tile(tile))
             self._tiles.append(tile)
+        self._index_by_path = {
+            img.filepath: i for i, img in enumerate(new_images)
+        }
 
-        # Load initial thumbnails immediately
-        self._load_initial_thumbnails()
-        # Load remaining thumbnails in background
+        self._selected_index = 0
+        if self._tiles:
+            self._tiles[0].set_selected(True)
+        self._update_status()
+        # Pick up anything the previous load had not decoded yet
         self._load_thumbnails_async()
 
     def _load_thumbnails_async(self) -> None:
-    """Load thumbnail images in a background thread with parallel processing."""
-    self._loading_cancelled = False  # Reset cancellation flag
-    images_to_load = list(enumerate(self._images))
-
-    # Use thread pool to load thumbnails in parallel
-    with ThreadPoolExecutor(max_workers=4) as executor:
-        futures = {executor.submit(self._load_thumbnail, img, idx): idx for idx, img in images_to_load}
-        for future in as_completed(futures):
-            idx = futures[future]
-            try:
-                pixbuf = future.result()
-                self._tiles[idx].set_pixbuf(pixbuf)
-            except Exception as e:
-                print(f"Error loading thumbnail {idx}: {e}")
-
-    # Update UI to show progress
-    self._update_status("Loading thumbnails in background...")
-
-    # Start periodic column check if not already running
-    if self._size_timer_id is None:
-        self._size_timer_id = GLib.timeout_add(100, self._update_columns_periodic)
-
-    # Cancel any pending stop and schedule a new one
-    if self._size_idle_id is not None:
-        GLib.source_remove(self._size_idle_id)
-    self._size_idle_id = GLib.idle_add(self._stop_size_timer_delayed)
-
-    # Update UI to show progress
-    self._update_status("Loading thumbnails in background...")
-        """Load thumbnail images in a background thread."""
-        self._loading_cancelled = False  # Reset cancellation flag
-        images_to_load = list(enumerate(self._images))
-
-        def _load():
-            for i, img in images_to_load:
-                # Check if loading was cancelled
-                if self._loading_cancelled:
-                    return
-                thumb_path = get_or_create_thumbnail(
-                    img.filepath,
-                    img.file_modified,
-                    self._config.thumbnail_size,
-                    self._config.thumbnail_cache_size,
-                )
-                if self._loading_cancelled:
-                    return
-                if thumb_path:
-                    GLib.idle_add(self._set_tile_thumbnail, i, thumb_path)
-                else:
-                    # Try loading directly with GdkPixbuf
-                    GLib.idle_add(self._set_tile_pixbuf_from_file, i, img.filepath)
-
-        thread = threading.Thread(target=_load, daemon=True)
-        thread.start()
-
-    def _set_tile_thumbnail(self, index: int, thumb_path: str) -> bool:
-        """Set a tile's thumbnail from a cached file path (called on main thread)."""
-        if index < len(self._tiles):
-            try:
-                pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(
-                    thumb_path,
-                    self._config.thumbnail_size,
-                    self._config.thumbnail_size,
-                    True,
-                )
-                self._tiles[index].set_pixbuf(pixbuf)
-            except Exception:
-                pass
-        return False
+        """Decode thumbnails in the background, viewport-first.
 
-    def _set_tile_pixbuf_from_file(self, index: int, filepath: str) -> bool:
-        """Set a tile's thumbnail directly from the image file (fallback)."""
-        if index < len(self._tiles):
-            try:
-                pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(
-                    filepath,
-                    self._config.thumbnail_size,
-                    self._config.thumbnail_size,
-                    True,
-                )
-                self._tiles[index].set_pixbuf(pixbuf)
-            except Exception:
-                pass
+        Indices go through a priority queue (0 = visible, 1 = one page away,
+        2 = rest) that _on_scroll re-prioritizes as the user moves, so a
+        10k-image directory pays decode cost proportional to what's shown,
+        not to N. The worker skips indices that already completed, which
+        makes re-enqueueing duplicates on scroll harmless.
+        """
+        # Retire the previous worker before resetting the cancel flag
+        if self._thumb_queue is not None:
+            self._thumb_queue.put(_QUEUE_STOP)
+        self._loading_cancelled = False
+        self._thumb_queue = queue.PriorityQueue()
+        # Indices whose texture is already cached were applied at tile
+        # construction; only the misses need decoding
+        self._loaded_indices = {
+            i
+            for i, img in enumerate(self._images)
+            if img.filepath in self._texture_cache
+        }
+        self._last_visible_range = (0, 0)
+        with self._pending_lock:
+            self._pending_textures = []
+        self._enqueue_pending()
+
+        # All workers drain the same queue; each exiting worker re-puts the
+        # stop sentinel so a single put from cleanup() stops the whole set
+        for _ in range(_POOL_WORKERS):
+            _DECODE_POOL.submit(
+                self._thumb_worker, self._thumb_queue, self._generation
+            )
+
+    def _visible_index_range(self) -> tuple[int, int]:
+        """Estimate which image indices the viewport currently shows."""
+        vadj = self._scrolled.get_vadjustment()
+        if vadj is None or not self._images:
+            return (0, 0)
+        cols = max(1, self._get_columns())
+        # Tile height: picture plus two label rows, margins and row spacing
+        row_height = self._config.thumbnail_size + 56
+        first_row = max(0, int(vadj.get_value()) // row_height)
+        visible_rows = int(vadj.get_page_size()) // row_height + 2
+        start = first_row * cols
+        end = min(len(self._images), (first_row + visible_rows) * cols)
+        return (start, end)
+
+    def _enqueue_pending(self) -> None:
+        """Queue every not-yet-loaded index, prioritized by viewport distance."""
+        if self._thumb_queue is None:
+            return
+        start, end = self._visible_index_range()
+        band = max(end - start, 1)  # One extra page of prefetch on each side
+        for i in range(len(self._images)):
+            if i in self._loaded_indices:
+                continue
+            if start <= i < end:
+                priority = 0
+            elif start - band <= i < end + band:
+                priority = 1
+            else:
+                priority = 2
+            self._queue_seq += 1
+            self._thumb_queue.put((priority, self._queue_seq, i))
+
+    def _on_scroll(self, vadj: Gtk.Adjustment) -> None:
+        """Bump decode priority for the indices scrolled into view."""
+        visible = self._visible_index_range()
+        if visible != self._last_visible_range:
+            self._last_visible_range = visible
+            self._enqueue_pending()
+
+    # Flush decoded pixbufs to the main loop every this many tiles or after
+    # one frame's worth of time, whichever comes first
+    _BATCH_SIZE = 16
+    _BATCH_INTERVAL = 0.016
+
+    def _thumb_worker(self, thumb_queue: "queue.PriorityQueue", gen: int) -> None:
+        """Drain the priority queue on a pool thread; several run at once."""
+        last_flush = time.monotonic()
+        while True:
+            _, _, index = thumb_queue.get()
+            if (
+                index is None
+                or self._loading_cancelled
+                or gen != self._generation
+            ):
+                thumb_queue.put(_QUEUE_STOP)  # Propagate to sibling workers
+                self._flush_pending(gen)
+                return
+            if index in self._loaded_indices or index >= len(self._images):
+                continue
+            # Claim before decoding so sibling workers skip it; a duplicate
+            # slipping through the unlocked check just decodes twice
+            self._loaded_indices.add(index)
+            img = self._images[index]
+            thumb_path = get_or_create_thumbnail(
+                img.filepath,
+                img.file_modified,
+                self._config.thumbnail_size,
+                self._config.thumbnail_cache_size,
+            )
+            if self._loading_cancelled:
+                return
+            # Decode and build the texture here, on the worker: GdkPixbuf
+            # releases the GIL during JPEG decode, texture construction from
+            # a pixbuf is thread-safe, and the main loop then only pays for a
+            # set_paintable ref bump instead of a decode plus GPU upload
+            pixbuf = self._decode_pixbuf(thumb_path or img.filepath)
+            if pixbuf is not None:
+                texture = Gdk.Texture.new_for_pixbuf(pixbuf)
+                self._texture_cache[img.filepath] = texture
+                with self._pending_lock:
+                    self._pending_textures.append((index, texture))
+                    count = len(self._pending_textures)
+            else:
+                count = 0
+            now = time.monotonic()
+            if (
+                count >= self._BATCH_SIZE
+                or now - last_flush > self._BATCH_INTERVAL
+                or thumb_queue.empty()
+            ):
+                last_flush = now
+                self._flush_pending(gen)
+
+    def _flush_pending(self, gen: int) -> None:
+        """Schedule one main-loop callback for everything decoded so far."""
+        with self._pending_lock:
+            batch, self._pending_textures = self._pending_textures, []
+        if batch:
+            # DEFAULT_IDLE so a large batch never preempts input handling
+            GLib.idle_add(
+                self._apply_batch,
+                gen,
+                batch,
+                priority=GLib.PRIORITY_DEFAULT_IDLE,
+            )
+
+    def _apply_batch(
+        self, gen: int, batch: list[tuple[int, Gdk.Texture]]
+    ) -> bool:
+        """Apply a batch of worker-built textures (called on main thread)."""
+        if gen != self._generation:
+            # The grid changed between decode and dispatch; these indices
+            # belong to the old layout. The textures stay in _texture_cache.
+            return False
+        n_tiles = len(self._tiles)
+        for index, texture in batch:
+            if index < n_tiles:
+                self._tiles[index].set_texture(texture)
         return False
 
+    def _decode_pixbuf(self, path: str) -> Optional[GdkPixbuf.Pixbuf]:
+        """Decode an image file at thumbnail size. Safe off the main thread."""
+        if HAS_TURBOJPEG and path.lower().endswith((".jpg", ".jpeg")):
+            pixbuf = self._decode_jpeg_turbo(path)
+            if pixbuf is not None:
+                return pixbuf
+        try:
+            return GdkPixbuf.Pixbuf.new_from_file_at_scale(
+                path,
+                self._config.thumbnail_size,
+                self._config.thumbnail_size,
+                True,
+            )
+        except Exception:
+            return None
+
+    def _decode_jpeg_turbo(self, path: str) -> Optional[GdkPixbuf.Pixbuf]:
+        """Decode a JPEG via libjpeg-turbo at a fractional DCT scale.
+
+        Picks the largest 1/2, 1/4, 1/8 denominator whose output still covers
+        the thumbnail size, so most of the IDCT work is skipped outright. The
+        result may be somewhat larger than the target; Gtk.Picture's CONTAIN
+        fit handles the final scale. Returns None to fall back to GdkPixbuf.
+        """
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            width, height, _, _ = _TURBO.decode_header(data)
+            target = self._config.thumbnail_size
+            denom = 1
+            for n in (8, 4, 2):
+                if max(width, height) // n >= target:
+                    denom = n
+                    break
+            arr = _TURBO.decode(
+                data, pixel_format=TJPF_RGB, scaling_factor=(1, denom)
+            )
+            h, w = arr.shape[:2]
+            return GdkPixbuf.Pixbuf.new_from_bytes(
+                GLib.Bytes.new(arr.tobytes()),
+                GdkPixbuf.Colorspace.RGB,
+                False,
+                8,
+                w,
+                h,
+                w * 3,
+            )
+        except Exception:
+            return None
+
     def _update_status(self) -> None:
         """Update the status bar text."""
         total = len(self._images)
-        viewed = sum(1 for img in self._images if img.viewed)
+        viewed = self._viewed_count
         unviewed = total - viewed
         if total > 0:
             sel = self._selected_index + 1
@@ -647,25 +963,26 @@ class ThumbnailView(Gtk.Box):
             vadj.set_value(widget_y)
 
     def _on_tile_clicked(
-        self, gesture: Gtk.GestureClick, n_press: int, x: float, y: float, index: int
+        self,
+        gesture: Gtk.GestureClick,
+        n_press: int,
+        x: float,
+        y: float,
+        tile: ThumbnailTile,
     ) -> None:
         """Handle tile click: single click selects, double click opens slideshow."""
+        index = self._index_by_path.get(tile.image_info.filepath)
+        if index is None:
+            return
         self._select(index)
         if n_press >= 2:
             self._open_slideshow(index)
 
-    def _on_tile_hover(
-        self, controller: Gtk.EventControllerMotion, x: float, y: float, index: int
-    ) -> None:
-        """Handle mouse hover: select the hovered tile."""
-        self._select(index)
-
     def _on_sort_changed(self, combo: Gtk.DropDown, _param) -> None:
         """Handle sort order change."""
-        sort_names = [s[0] for s in SORT_OPTIONS]
         idx = combo.get_selected()
-        if 0 <= idx < len(sort_names):
-            new_sort = sort_names[idx]
+        if 0 <= idx < len(SORT_NAMES):
+            new_sort = SORT_NAMES[idx]
             self._config.sort = new_sort
             sorted_images = sort_images(self._images, new_sort)
             self.load_images(sorted_images)
@@ -691,6 +1008,20 @@ class ThumbnailView(Gtk.Box):
         """Open the slideshow view starting at the given index."""
         self._window.show_slideshow(self._images, start_index=start_index, auto_play=True)
 
+    # Keyval -> action table, filled in after the class body (the handlers
+    # need the method objects to exist). Dispatch is one dict probe per
+    # keypress instead of a ~15-branch elif chain re-reading Gdk.KEY_*.
+    _KEY_TABLE: ClassVar[dict[int, Callable[["ThumbnailView"], None]]] = {}
+
+    def _select_row_up(self) -> None:
+        self._select(self._selected_index - max(1, self._get_columns()))
+
+    def _select_row_down(self) -> None:
+        self._select(self._selected_index + max(1, self._get_columns()))
+
+    def _quit(self) -> None:
+        self._window.get_application().quit()
+
     def _on_key_pressed(
         self,
         controller: Gtk.EventControllerKey,
@@ -699,76 +1030,12 @@ class ThumbnailView(Gtk.Box):
         state: Gdk.ModifierType,
     ) -> bool:
         """Handle keyboard input."""
-        # Calculate columns for grid navigation
-        cols = max(1, self._get_columns())
-
-        # Numpad navigation
-        if keyval == Gdk.KEY_KP_8:  # Up
-            self._select(self._selected_index - cols)
-            return True
-        elif keyval == Gdk.KEY_KP_2:  # Down
-            self._select(self._selected_index + cols)
-            return True
-        elif keyval == Gdk.KEY_KP_4:  # Left
-            self._select(self._selected_index - 1)
-            return True
-        elif keyval == Gdk.KEY_KP_6:  # Right
-            self._select(self._selected_index + 1)
-            return True
-
-        # Arrow keys also work
-        elif keyval == Gdk.KEY_Up:
-            self._select(self._selected_index - cols)
-            return True
-        elif keyval == Gdk.KEY_Down:
-            self._select(self._selected_index + cols)
-            return True
-        elif keyval == Gdk.KEY_Left:
-            self._select(self._selected_index - 1)
-            return True
-        elif keyval == Gdk.KEY_Right:
-            self._select(self._selected_index + 1)
-            return True
-
-        # Rating
-        elif keyval in (Gdk.KEY_KP_Add, Gdk.KEY_plus):
-            self._change_rating(+1)
-            return True
-        elif keyval in (Gdk.KEY_KP_Subtract, Gdk.KEY_minus):
-            self._change_rating(-1)
-            return True
-
-        # Sort order cycling
-        elif keyval in (Gdk.KEY_t, Gdk.KEY_T):
-            self._cycle_sort()
-            return True
-
-        # Open slideshow
-        elif keyval in (Gdk.KEY_Return, Gdk.KEY_KP_Enter, Gdk.KEY_space):
-            self._open_slideshow(self._selected_index)
-            return True
-
-        # Start slideshow from beginning of sorted list
-        elif keyval in (Gdk.KEY_s, Gdk.KEY_S):
-            self._open_slideshow(0)
-            return True
-
-        # Quit
-        elif keyval in (Gdk.KEY_q, Gdk.KEY_Q, Gdk.KEY_Escape):
-            self._window.get_application().quit()
-            return True
-
-        # Delete selected image
-        elif keyval == Gdk.KEY_Delete:
-            self._delete_selected_image()
-            return True
-
-        # Help
-        elif keyval in (Gdk.KEY_question, Gdk.KEY_F1):
-            self._show_help()
-            return True
-
-        return False
+        # Fold case once so the table needs no uppercase duplicates
+        handler = self._KEY_TABLE.get(Gdk.keyval_to_lower(keyval))
+        if handler is None:
+            return False
+        handler(self)
+        return True
 
     def handle_key(self, keyval: int) -> bool:
         """Public method to handle a key press from window-level controller."""
@@ -777,16 +1044,14 @@ class ThumbnailView(Gtk.Box):
     def cleanup(self) -> None:
         """Cancel background thumbnail loading. Call before switching views or closing."""
         self._loading_cancelled = True
+        if self._thumb_queue is not None:
+            self._thumb_queue.put(_QUEUE_STOP)  # Wake the worker so it can exit
 
     def _cycle_sort(self) -> None:
         """Cycle through sort options."""
-        sort_names = [s[0] for s in SORT_OPTIONS]
-        try:
-            current_idx = sort_names.index(self._config.sort)
-        except ValueError:
-            current_idx = 0
-        next_idx = (current_idx + 1) % len(sort_names)
-        new_sort = sort_names[next_idx]
+        current_idx = _SORT_INDEX.get(self._config.sort, 0)
+        next_idx = (current_idx + 1) % len(SORT_NAMES)
+        new_sort = SORT_NAMES[next_idx]
         self._config.sort = new_sort
         # Update dropdown
         self._sort_combo.set_selected(next_idx)
@@ -867,33 +1132,55 @@ Other:
         dialog.present()
     
     def _do_delete_image(self, img: "ImageInfo") -> None:
-        """Actually delete the image from disk and update the view."""
+        """Actually delete the image from disk and update the view.
+
+        Removes the one affected FlowBoxChild in place instead of rebuilding
+        (and re-decoding) the whole grid, so deleting from a large directory
+        stays O(1) widget work plus an index fixup.
+        """
         from pathlib import Path
-        
+
         try:
             # Delete the file
             filepath = Path(img.filepath)
             if filepath.exists():
                 filepath.unlink()
                 print(f"Deleted: {img.filepath}")
-            
+
             # Remove from database
             if self._app.db:
                 self._app.db.delete_image(img.filepath)
-            
-            # Remove from images list
-            old_index = self._selected_index
-            self._images.remove(img)
+
+            idx = self._index_by_path.get(img.filepath)
+            if idx is None:
+                return
+
+            fb_child = self._flow.get_child_at_index(idx)
+            if fb_child is not None:
+                self._flow.remove(fb_child)
+            if img.viewed:
+                self._viewed_count -= 1
+            del self._images[idx]
+            del self._tiles[idx]
             self._app.images = self._images
-            
-            # Rebuild the grid
-            self.load_images(self._images)
-            
-            # Adjust selection
-            if self._selected_index >= len(self._images):
-                self._selected_index = max(0, len(self._images) - 1)
-            self._select(self._selected_index)
-            
+
+            # Indices after the removed tile shift down by one; bump the
+            # generation so in-flight decodes aimed at old indices are dropped
+            self._generation += 1
+            self._index_by_path = {
+                image.filepath: i for i, image in enumerate(self._images)
+            }
+            # The stale generation makes the current workers exit, so start a
+            # fresh set; the texture cache keeps this from re-decoding
+            # anything already done
+            self._load_thumbnails_async()
+
+            if self._images:
+                self._select(min(idx, len(self._images) - 1))
+            else:
+                self._selected_index = 0
+                self._update_status()
+
         except Exception as e:
             print(f"Error deleting image: {e}")
 
@@ -904,3 +1191,38 @@ Other:
             return 1
         tile_width = self._config.thumbnail_size + 16  # tile + margins
         return max(1, width // tile_width)
+
+
+ThumbnailView._KEY_TABLE.update({
+    # Navigation - numpad and arrow keys
+    Gdk.KEY_KP_8: ThumbnailView._select_row_up,
+    Gdk.KEY_Up: ThumbnailView._select_row_up,
+    Gdk.KEY_KP_2: ThumbnailView._select_row_down,
+    Gdk.KEY_Down: ThumbnailView._select_row_down,
+    Gdk.KEY_KP_4: lambda v: v._select(v._selected_index - 1),
+    Gdk.KEY_Left: lambda v: v._select(v._selected_index - 1),
+    Gdk.KEY_KP_6: lambda v: v._select(v._selected_index + 1),
+    Gdk.KEY_Right: lambda v: v._select(v._selected_index + 1),
+
+    # Rating
+    Gdk.KEY_KP_Add: lambda v: v._change_rating(+1),
+    Gdk.KEY_plus: lambda v: v._change_rating(+1),
+    Gdk.KEY_KP_Subtract: lambda v: v._change_rating(-1),
+    Gdk.KEY_minus: lambda v: v._change_rating(-1),
+
+    # Sort order cycling
+    Gdk.KEY_t: ThumbnailView._cycle_sort,
+
+    # Slideshow: at selection, or from the start of the sorted list
+    Gdk.KEY_Return: lambda v: v._open_slideshow(v._selected_index),
+    Gdk.KEY_KP_Enter: lambda v: v._open_slideshow(v._selected_index),
+    Gdk.KEY_space: lambda v: v._open_slideshow(v._selected_index),
+    Gdk.KEY_s: lambda v: v._open_slideshow(0),
+
+    # Other
+    Gdk.KEY_q: ThumbnailView._quit,
+    Gdk.KEY_Escape: ThumbnailView._quit,
+    Gdk.KEY_Delete: ThumbnailView._delete_selected_image,
+    Gdk.KEY_question: ThumbnailView._show_help,
+    Gdk.KEY_F1: ThumbnailView._show_help,
+})